@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .database import Base, engine
 from .routers import edge, element, hello_world, node, resource
@@ -10,7 +11,8 @@ Base.metadata.create_all(bind=engine)
 app = FastAPI(
     title="SpaceNet Database API",
     description="API to perform SpaceNet database operations.",
-    version="0.0"
+    version="0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # include any application routers
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Enum, Integer, String, Float
 from sqlalchemy.orm import declared_attr
 
 from ..database import Base
@@ -9,19 +9,23 @@ class Edge(Base):
     __tablename__ = "Edges"
 
     id = Column(Integer, primary_key=True, index=True)
-    type = Column(String)
+    type = Column(Enum(EdgeType), index=True, nullable=False)
     name = Column(String)
     description = Column(String)
     origin_id = Column(Integer)
     destination_id = Column(Integer)
 
-    __mapper_args__ = {"polymorphic_on": type, "polymorphic_identity": "edge"}
+    __mapper_args__ = {
+        "polymorphic_on": type,
+        "polymorphic_identity": "edge",
+        "with_polymorphic": "*",
+    }
 
 
 class SurfaceEdge(Edge):
     distance = Column(Float)
 
-    __mapper_args__ = {"polymorphic_identity": EdgeType.Surface.value}
+    __mapper_args__ = {"polymorphic_identity": EdgeType.Surface}
 
 
 class EdgeWithDuration(Edge):
@@ -34,11 +38,11 @@ class EdgeWithDuration(Edge):
 
 class SpaceEdge(EdgeWithDuration):
 
-    __mapper_args__ = {"polymorphic_identity": EdgeType.Space.value}
+    __mapper_args__ = {"polymorphic_identity": EdgeType.Space}
 
 
 class FlightEdge(EdgeWithDuration):
     max_crew = Column(Integer)
     max_cargo = Column(Float)
 
-    __mapper_args__ = {"polymorphic_identity": EdgeType.Flight.value}
+    __mapper_args__ = {"polymorphic_identity": EdgeType.Flight}
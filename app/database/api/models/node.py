@@ -1,24 +1,30 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Enum, Integer, String, Float
 from ..database import Base
-from spacenet.schemas.node import NodeType
+from spacenet.schemas.node import Body, NodeType
 
 class Node(Base):
     __tablename__ = "Nodes"
 
     id = Column(Integer, primary_key=True, index=True)
-    type = Column(String)
+    type = Column(Enum(NodeType), index=True, nullable=False)
     name = Column(String)
     description = Column(String)
-    body_1 = Column(String)
+    body_1 = Column(Enum(Body), index=True, nullable=False)
 
-    __mapper_args__ = {"polymorphic_on": type, "polymorphic_identity": "node"}
+    # subclasses share this table, so load their columns up front rather than per row;
+    # the edge and resource models do the same
+    __mapper_args__ = {
+        "polymorphic_on": type,
+        "polymorphic_identity": "node",
+        "with_polymorphic": "*",
+    }
 
 
 class SurfaceNode(Node):
     latitude = Column(Float)
     longitude = Column(Float)
 
-    __mapper_args__ = {"polymorphic_identity": NodeType.Surface.value}
+    __mapper_args__ = {"polymorphic_identity": NodeType.Surface}
 
 
 class OrbitalNode(Node):
@@ -26,11 +32,11 @@ class OrbitalNode(Node):
     periapsis = Column(Float)
     inclination = Column(Float)
 
-    __mapper_args__ = {"polymorphic_identity": NodeType.Orbital.value}
+    __mapper_args__ = {"polymorphic_identity": NodeType.Orbital}
 
 
 class LagrangeNode(Node):
-    body_2 = Column(String)
+    body_2 = Column(Enum(Body))
     lp_number = Column(Integer)
 
-    __mapper_args__ = {"polymorphic_identity": NodeType.Lagrange.value}
+    __mapper_args__ = {"polymorphic_identity": NodeType.Lagrange}
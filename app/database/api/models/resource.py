@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Integer, String, Float
+from typing import Any, Dict
+
+from sqlalchemy import Column, Enum, Integer, String, Float
 from sqlalchemy.orm import declared_attr
 
 from ..database import Base
@@ -9,24 +11,56 @@ class Resource(Base):
     __tablename__ = "Resources"
 
     id = Column(Integer, primary_key=True, index=True)
-    type = Column(String)
+    type = Column(Enum(ResourceType), index=True, nullable=False)
     name = Column(String)
     description = Column(String)
     cos = Column(Integer)
     units = Column(String)
 
-    __mapper_args__ = {"polymorphic_identity": "resource", "polymorphic_on": type}
+    __mapper_args__ = {
+        "polymorphic_identity": "resource",
+        "polymorphic_on": type,
+        "with_polymorphic": "*",
+    }
+
+    def _schema_kwargs(self, unit_mass, unit_volume) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type,
+            "name": self.name,
+            "description": self.description,
+            "cos": self.cos,
+            "units": self.units,
+            "unit_mass": unit_mass,
+            "unit_volume": unit_volume,
+        }
 
 
 class DiscreteResource(Resource):
     unit_mass_i = Column(Integer)
     unit_volume_i = Column(Integer)
 
-    __mapper_args__ = {"polymorphic_identity": ResourceType.discrete.value}
+    __mapper_args__ = {"polymorphic_identity": ResourceType.discrete}
+
+    def to_schema_kwargs(self) -> Dict[str, Any]:
+        """
+        Convert this row to keyword arguments for the discrete resource read schema.
+
+        :return: dictionary mapping schema field names to values
+        """
+        return self._schema_kwargs(self.unit_mass_i, self.unit_volume_i)
 
 
 class ContinuousResource(Resource):
     unit_mass_f = Column(Float)
     unit_volume_f = Column(Float)
 
-    __mapper_args__ = {"polymorphic_identity": ResourceType.continuous.value}
+    __mapper_args__ = {"polymorphic_identity": ResourceType.continuous}
+
+    def to_schema_kwargs(self) -> Dict[str, Any]:
+        """
+        Convert this row to keyword arguments for the continuous resource read schema.
+
+        :return: dictionary mapping schema field names to values
+        """
+        return self._schema_kwargs(self.unit_mass_f, self.unit_volume_f)
@@ -1,59 +1,94 @@
-from typing import List, Union
-from fastapi import Depends, APIRouter, HTTPException, status
+from functools import partial
+from typing import List, Optional, Union
+from fastapi import Body, Depends, APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
+from pydantic import Field
 from sqlalchemy.orm import Session
+from typing_extensions import Annotated
 from starlette import status
 
 from .. import database
 from ..models import edge as models
 from ..schemas.edge import *
-from ..models.utilities import dictify_row
+from .utilities import conditional_response, create_all, paginate, to_response_dict
 
 # Build a new router
 router = APIRouter()
 
-Edges = Union[SurfaceEdge, SpaceEdge, FlightEdge]
-UpdateEdges = Union[UpdateSurfaceEdge, UpdateSpaceEdge, UpdateFlightEdge]
-ReadEdges = Union[ReadSurfaceEdge, ReadSpaceEdge, ReadFlightEdge]
+Edges = Annotated[Union[SurfaceEdge, SpaceEdge, FlightEdge], Body(discriminator="type")]
+UpdateEdges = Annotated[
+    Union[UpdateSurfaceEdge, UpdateSpaceEdge, UpdateFlightEdge],
+    Body(discriminator="type"),
+]
+BulkEdges = List[
+    Annotated[Union[SurfaceEdge, SpaceEdge, FlightEdge], Field(discriminator="type")]
+]
+ReadEdges = Annotated[
+    Union[ReadSurfaceEdge, ReadSpaceEdge, ReadFlightEdge], Field(discriminator="type")
+]
 
 SCHEMA_TO_MODEL = {
     SurfaceEdge: models.SurfaceEdge,
     SpaceEdge: models.SpaceEdge,
     FlightEdge: models.FlightEdge,
 }
+MODEL_TO_READ_SCHEMA = {
+    models.SurfaceEdge: ReadSurfaceEdge,
+    models.SpaceEdge: ReadSpaceEdge,
+    models.FlightEdge: ReadFlightEdge,
+}
 NOT_FOUND_RESPONSE = {status.HTTP_404_NOT_FOUND: {"msg": str}}
 
 
 # Bind a route to list objects
 @router.get("/", response_model=List[ReadEdges])
-def list_edges(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    db_edges = db.query(models.Edge).offset(skip).limit(limit).all()
-    return db_edges
+def list_edges(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[int] = None,
+    db: Session = Depends(database.get_db),
+):
+    db_edges = paginate(db.query(models.Edge), models.Edge.id, skip, limit, after)
+    return ORJSONResponse(
+        [to_response_dict(MODEL_TO_READ_SCHEMA, db_edge) for db_edge in db_edges]
+    )
 
 #Bind a route to read an object by ID
 @router.get("/{edge_id}", response_model = ReadEdges, responses = NOT_FOUND_RESPONSE)
-def read_edge(edge_id: int, db: Session = Depends(database.get_db)):
-    db_edge = db.query(models.Edge).get(edge_id)
+def read_edge(edge_id: int, request: Request, db: Session = Depends(database.get_db)):
+    db_edge = db.get(models.Edge, edge_id)
     if db_edge is None:
         raise HTTPException(
             status_code=404, detail="Edge {:d} not found".format(edge_id)
         )
-    return db_edge
+    return conditional_response(
+        request, to_response_dict(MODEL_TO_READ_SCHEMA, db_edge)
+    )
 
 # Bind a route to create a new object
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=ReadEdges)
 def create_edge(edge: Edges, db: Session = Depends(database.get_db)):
-    db_edge = SCHEMA_TO_MODEL[type(edge)](**edge.dict())
+    db_edge = SCHEMA_TO_MODEL[type(edge)](**edge.__dict__)
     db.add(db_edge)
     db.commit()
     db.refresh(db_edge)
-    return db_edge
+    return ORJSONResponse(
+        to_response_dict(MODEL_TO_READ_SCHEMA, db_edge),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+# Bind a route to create many objects in one transaction
+@router.post("/bulk", status_code=status.HTTP_201_CREATED, response_model=List[ReadEdges])
+def create_edges(edges: BulkEdges = Body(...), db: Session = Depends(database.get_db)):
+    db_edges = [SCHEMA_TO_MODEL[type(edge)](**edge.__dict__) for edge in edges]
+    return create_all(db, db_edges, partial(to_response_dict, MODEL_TO_READ_SCHEMA))
 
 # Bind a route to update an object by ID
 @router.patch("/{edge_id}", response_model=ReadEdges, responses=NOT_FOUND_RESPONSE)
 def update_edge(
     edge_id: int, edge: UpdateEdges, db: Session = Depends(database.get_db)
 ):
-    db_edge = db.query(models.Edge).get(edge_id)
+    db_edge = db.get(models.Edge, edge_id)
     if db_edge is None:
         raise HTTPException(
             status_code=404, detail="Edge {:d} not found".format(edge_id)
@@ -64,22 +99,22 @@ def update_edge(
             detail=f"Edge found with id={edge_id} is of type {db_edge.type}; cannot update "
             f"type to {edge.type} ",
         )
-    for field_name, field in edge.dict().items():
+    for field_name, field in edge.dict(exclude_unset=True).items():
         if field_name != "type" and field is not None:
             setattr(db_edge, field_name, field)
     db.commit()
-    return db_edge
+    return ORJSONResponse(to_response_dict(MODEL_TO_READ_SCHEMA, db_edge))
 
 
 # Bind a route to delete an object by ID
 @router.delete("/{edge_id}", response_model=ReadEdges)
 def delete_edge(edge_id: int, db: Session = Depends(database.get_db)):
-    db_edge = db.query(models.Edge).get(edge_id)
+    db_edge = db.get(models.Edge, edge_id)
     if db_edge is None:
         raise HTTPException(
             status_code=404, detail="Edge {:d} not found".format(edge_id)
         )
-    as_dict = dictify_row(db_edge)
+    as_dict = to_response_dict(MODEL_TO_READ_SCHEMA, db_edge)
     db.delete(db_edge)
     db.commit()
-    return as_dict
+    return ORJSONResponse(as_dict)
@@ -1,43 +1,55 @@
 from typing import List, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
+from pydantic import Field
 from sqlalchemy.orm import Session
+from typing_extensions import Annotated
 
 from .. import database
 from ..models import element as models
 from ..schemas.element import *
-from ..models.utilities import dictify_row
+from .utilities import to_response_dict
 
 router = APIRouter()
 
-Elements = Union[
-    Element,
-    ElementCarrier,
-    SurfaceVehicle,
-    PropulsiveVehicle,
-    RoboticAgent,
-    HumanAgent,
-    ResourceContainer,
+Elements = Annotated[
+    Union[
+        Element,
+        ElementCarrier,
+        SurfaceVehicle,
+        PropulsiveVehicle,
+        RoboticAgent,
+        HumanAgent,
+        ResourceContainer,
+    ],
+    Body(discriminator="type"),
 ]
 
-UpdateElements = Union[
-    UpdateElement,
-    UpdateElementCarrier,
-    UpdateSurfaceVehicle,
-    UpdatePropulsiveVehicle,
-    UpdateRoboticAgent,
-    UpdateHumanAgent,
-    UpdateResourceContainer,
+UpdateElements = Annotated[
+    Union[
+        UpdateElement,
+        UpdateElementCarrier,
+        UpdateSurfaceVehicle,
+        UpdatePropulsiveVehicle,
+        UpdateRoboticAgent,
+        UpdateHumanAgent,
+        UpdateResourceContainer,
+    ],
+    Body(discriminator="type"),
 ]
 
-ReadElements = Union[
-    ReadElement,
-    ReadElementCarrier,
-    ReadSurfaceVehicle,
-    ReadPropulsiveVehicle,
-    ReadRoboticAgent,
-    ReadHumanAgent,
-    ReadResourceContainer,
+ReadElements = Annotated[
+    Union[
+        ReadElement,
+        ReadElementCarrier,
+        ReadSurfaceVehicle,
+        ReadPropulsiveVehicle,
+        ReadRoboticAgent,
+        ReadHumanAgent,
+        ReadResourceContainer,
+    ],
+    Field(discriminator="type"),
 ]
 
 SCHEMA_TO_MODEL = {
@@ -50,6 +62,16 @@ SCHEMA_TO_MODEL = {
     SurfaceVehicle: models.SurfaceVehicle,
 }
 
+MODEL_TO_READ_SCHEMA = {
+    models.Element: ReadElement,
+    models.ElementCarrier: ReadElementCarrier,
+    models.ResourceContainer: ReadResourceContainer,
+    models.HumanAgent: ReadHumanAgent,
+    models.RoboticAgent: ReadRoboticAgent,
+    models.PropulsiveVehicle: ReadPropulsiveVehicle,
+    models.SurfaceVehicle: ReadSurfaceVehicle,
+}
+
 NOT_FOUND_RESPONSE = {status.HTTP_404_NOT_FOUND: {"msg": str}}
 
 
@@ -60,7 +82,9 @@ NOT_FOUND_RESPONSE = {status.HTTP_404_NOT_FOUND: {"msg": str}}
 )
 def list_elements(db: Session = Depends(database.get_db)):
     db_elements = db.query(models.Element).all()
-    return db_elements
+    return ORJSONResponse(
+        [to_response_dict(MODEL_TO_READ_SCHEMA, db_element) for db_element in db_elements]
+    )
 
 
 @router.get(
@@ -70,13 +94,13 @@ def list_elements(db: Session = Depends(database.get_db)):
     description="Find a specific element in the database.",
 )
 def read_element(id_: int, db: Session = Depends(database.get_db)):
-    db_element = db.query(models.Element).get(id_)
+    db_element = db.get(models.Element, id_)
     if db_element is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No element found with id={id_}",
         )
-    return db_element
+    return ORJSONResponse(to_response_dict(MODEL_TO_READ_SCHEMA, db_element))
 
 
 @router.post(
@@ -86,11 +110,14 @@ def read_element(id_: int, db: Session = Depends(database.get_db)):
     description="Add a new element to the database.",
 )
 def create_element(element: Elements, db: Session = Depends(database.get_db)):
-    db_element = SCHEMA_TO_MODEL[type(element)](**element.dict())
+    db_element = SCHEMA_TO_MODEL[type(element)](**element.__dict__)
     db.add(db_element)
     db.commit()
     db.refresh(db_element)
-    return db_element
+    return ORJSONResponse(
+        to_response_dict(MODEL_TO_READ_SCHEMA, db_element),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.patch(
@@ -102,7 +129,7 @@ def create_element(element: Elements, db: Session = Depends(database.get_db)):
 def patch_element(
     id_: int, element: UpdateElements, db: Session = Depends(database.get_db)
 ):
-    db_element = db.query(models.Element).get(id_)
+    db_element = db.get(models.Element, id_)
     if db_element is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -118,7 +145,7 @@ def patch_element(
         if field_name != "type" and field is not None:
             setattr(db_element, field_name, field)
     db.commit()
-    return db_element
+    return ORJSONResponse(to_response_dict(MODEL_TO_READ_SCHEMA, db_element))
 
 
 @router.delete(
@@ -128,13 +155,13 @@ def patch_element(
     description="Delete an element from the database.",
 )
 def delete_element(id_: int, db: Session = Depends(database.get_db)):
-    db_element = db.query(models.Element).get(id_)
+    db_element = db.get(models.Element, id_)
     if db_element is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No element found with id={id_}",
         )
-    as_dict = dictify_row(db_element)
+    as_dict = to_response_dict(MODEL_TO_READ_SCHEMA, db_element)
     db.delete(db_element)
     db.commit()
-    return as_dict
+    return ORJSONResponse(as_dict)
@@ -18,7 +18,7 @@ def list_hellos(skip: int = 0, limit: int = 100, db: Session = Depends(database.
 # bind a route to read an object by id
 @router.get("/{id}", response_model=schemas.HelloWorld)
 def read_hello(id: int, db: Session = Depends(database.get_db)):
-    db_hello = db.query(models.HelloWorld).get(id)
+    db_hello = db.get(models.HelloWorld, id)
     if db_hello is None:
         raise HTTPException(status_code=404, detail="Hello not found")
     return db_hello
@@ -26,7 +26,7 @@ def read_hello(id: int, db: Session = Depends(database.get_db)):
 # bind a route to create a new object
 @router.post("/", response_model=schemas.HelloWorld)
 def create_hello(hello: schemas.HelloWorldCreate, db: Session = Depends(database.get_db)):
-    db_hello = models.HelloWorld(**hello.dict())
+    db_hello = models.HelloWorld(**hello.__dict__)
     db.add(db_hello)
     db.commit()
     db.refresh(db_hello)
@@ -35,19 +35,19 @@ def create_hello(hello: schemas.HelloWorldCreate, db: Session = Depends(database
 # bind a route to update an object by id
 @router.put("/{id}", response_model=schemas.HelloWorld)
 def update_hello(id: int, hello: schemas.HelloWorldCreate, db: Session = Depends(database.get_db)):
-    db_hello = db.query(models.HelloWorld).get(id)
+    db_hello = db.get(models.HelloWorld, id)
     if db_hello is None:
         raise HTTPException(status_code=404, detail="Hello not found")
-    for field in hello.dict():
+    for field, value in hello.dict().items():
         if hasattr(db_hello, field):
-            setattr(db_hello, field, hello.dict()[field])
+            setattr(db_hello, field, value)
     db.commit()
     return db_hello
 
 # bind a route to delete an object by id
 @router.delete("/{id}", response_model=schemas.HelloWorld)
 def delete_hello(id: int, db: Session = Depends(database.get_db)):
-    db_hello = db.query(models.HelloWorld).get(id)
+    db_hello = db.get(models.HelloWorld, id)
     if db_hello is None:
         raise HTTPException(status_code=404, detail="Hello not found")
     db.delete(db_hello)
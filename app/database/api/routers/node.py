@@ -1,23 +1,43 @@
-from typing import List, Union
+from functools import partial
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
+from pydantic import Field
 from sqlalchemy.orm import Session
+from typing_extensions import Annotated
 
 from .. import database
 from ..models import node as models
-from ..models.utilities import dictify_row
 from ..schemas.node import *
+from .utilities import conditional_response, create_all, paginate, to_response_dict
 
 # from ..auth import oauth2_scheme
 
 
 router = APIRouter()
 
-Nodes = Union[SurfaceNode, OrbitalNode, LagrangeNode]
+# the unions are tagged by "type" so validation dispatches straight to one schema, as
+# in the other routers
+Nodes = Annotated[
+    Union[SurfaceNode, OrbitalNode, LagrangeNode], Body(discriminator="type")
+]
 
-UpdateNodes = Union[UpdateSurfaceNode, UpdateOrbitalNode, UpdateLagrangeNode]
+UpdateNodes = Annotated[
+    Union[UpdateSurfaceNode, UpdateOrbitalNode, UpdateLagrangeNode],
+    Body(discriminator="type"),
+]
 
-ReadNodes = Union[ReadSurfaceNode, ReadOrbitalNode, ReadLagrangeNode]
+BulkNodes = List[
+    Annotated[
+        Union[SurfaceNode, OrbitalNode, LagrangeNode], Field(discriminator="type")
+    ]
+]
+
+ReadNodes = Annotated[
+    Union[ReadSurfaceNode, ReadOrbitalNode, ReadLagrangeNode],
+    Field(discriminator="type"),
+]
 
 SCHEMA_TO_MODEL = {
     SurfaceNode: models.SurfaceNode,
@@ -25,6 +45,12 @@ SCHEMA_TO_MODEL = {
     LagrangeNode: models.LagrangeNode,
 }
 
+MODEL_TO_READ_SCHEMA = {
+    models.SurfaceNode: ReadSurfaceNode,
+    models.OrbitalNode: ReadOrbitalNode,
+    models.LagrangeNode: ReadLagrangeNode,
+}
+
 NOT_FOUND_RESPONSE = {status.HTTP_404_NOT_FOUND: {"msg": str}}
 
 
@@ -34,26 +60,51 @@ def create_node(
     # token: str = Depends(oauth2_scheme),
     db: Session = Depends(database.get_db),
 ):
-    db_node = SCHEMA_TO_MODEL[type(node)](**node.dict())
+    db_node = SCHEMA_TO_MODEL[type(node)](**node.__dict__)
     db.add(db_node)
     db.commit()
     db.refresh(db_node)
-    return db_node
+    return ORJSONResponse(
+        to_response_dict(MODEL_TO_READ_SCHEMA, db_node),
+        status_code=status.HTTP_201_CREATED,
+    )
+
+
+@router.post(
+    "/bulk", status_code=status.HTTP_201_CREATED, response_model=List[ReadNodes]
+)
+def create_nodes(
+    nodes: BulkNodes = Body(...),
+    # token: str = Depends(oauth2_scheme),
+    db: Session = Depends(database.get_db),
+):
+    db_nodes = [SCHEMA_TO_MODEL[type(node)](**node.__dict__) for node in nodes]
+    return create_all(db, db_nodes, partial(to_response_dict, MODEL_TO_READ_SCHEMA))
 
 
 @router.get("/", response_model=List[ReadNodes])
-def list_nodes(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    return db.query(models.Node).offset(skip).limit(limit).all()
+def list_nodes(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[int] = None,
+    db: Session = Depends(database.get_db),
+):
+    db_nodes = paginate(db.query(models.Node), models.Node.id, skip, limit, after)
+    return ORJSONResponse(
+        [to_response_dict(MODEL_TO_READ_SCHEMA, db_node) for db_node in db_nodes]
+    )
 
 
 @router.get("/{node_id}", responses=NOT_FOUND_RESPONSE, response_model=ReadNodes)
-def read_node(node_id: int, db: Session = Depends(database.get_db)):
-    db_node = db.query(models.Node).get(node_id)
+def read_node(node_id: int, request: Request, db: Session = Depends(database.get_db)):
+    db_node = db.get(models.Node, node_id)
     if db_node is None:
         raise HTTPException(
             status_code=404, detail="Node {:d} not found".format(node_id)
         )
-    return db_node
+    return conditional_response(
+        request, to_response_dict(MODEL_TO_READ_SCHEMA, db_node)
+    )
 
 
 @router.patch(
@@ -67,7 +118,7 @@ def update_node(
     # token: str = Depends(oauth2_scheme),
     db: Session = Depends(database.get_db),
 ):
-    db_node = db.query(models.Node).get(node_id)
+    db_node = db.get(models.Node, node_id)
     if db_node is None:
         raise HTTPException(
             status_code=404, detail="Node {:d} not found".format(node_id)
@@ -78,12 +129,12 @@ def update_node(
             detail=f"Node found with id={node_id} is of type {db_node.type}; cannot update "
             f"type to {node.type} ",
         )
-    for field_name, field in node.dict().items():
+    for field_name, field in node.dict(exclude_unset=True).items():
         if field_name != "type" and field is not None:
             setattr(db_node, field_name, field)
     db.commit()
     db.refresh(db_node)
-    return db_node
+    return ORJSONResponse(to_response_dict(MODEL_TO_READ_SCHEMA, db_node))
 
 
 @router.delete("/{node_id}", responses=NOT_FOUND_RESPONSE, response_model=ReadNodes)
@@ -92,12 +143,12 @@ def delete_node(
     # token: str = Depends(oauth2_scheme),
     db: Session = Depends(database.get_db),
 ):
-    db_node = db.query(models.Node).get(node_id)
+    db_node = db.get(models.Node, node_id)
     if db_node is None:
         raise HTTPException(
             status_code=404, detail="Node {:d} not found".format(node_id)
         )
-    as_dict = dictify_row(db_node)
+    as_dict = to_response_dict(MODEL_TO_READ_SCHEMA, db_node)
     db.delete(db_node)
     db.commit()
-    return as_dict
+    return ORJSONResponse(as_dict)
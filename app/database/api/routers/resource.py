@@ -1,27 +1,47 @@
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import Field
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from typing_extensions import Annotated
 
 from .. import database
 from ..models import resource as models
-from ..models.utilities import dictify_row
 from ..schemas.resource import *
+from .utilities import conditional_response, create_all, paginate
 from spacenet.schemas.resource import ResourceType
 
 router = APIRouter()
 
-Resources = Union[ContinuousResource, DiscreteResource]
+Resources = Annotated[
+    Union[ContinuousResource, DiscreteResource], Body(discriminator="type")
+]
 
-UpdateResources = Union[UpdateContinuous, UpdateDiscrete]
+UpdateResources = Annotated[
+    Union[UpdateContinuous, UpdateDiscrete], Body(discriminator="type")
+]
 
-ReadResources = Union[ReadContinuous, ReadDiscrete]
+BulkResources = List[
+    Annotated[Union[ContinuousResource, DiscreteResource], Field(discriminator="type")]
+]
+
+ReadResources = Annotated[
+    Union[ReadContinuous, ReadDiscrete], Field(discriminator="type")
+]
 
 SCHEMA_TO_MODEL = {
     ContinuousResource: models.ContinuousResource,
     DiscreteResource: models.DiscreteResource,
 }
 
+MODEL_TO_READ_SCHEMA = {
+    models.ContinuousResource: ReadContinuous,
+    models.DiscreteResource: ReadDiscrete,
+}
+
 NOT_FOUND_RESPONSE = {status.HTTP_404_NOT_FOUND: {"msg": str}}
 
 # COMMON_FIELDS = {"id", "type", "name", "description", "cos", "units"}
@@ -29,29 +49,27 @@ NOT_FOUND_RESPONSE = {status.HTTP_404_NOT_FOUND: {"msg": str}}
 # DISCRETE_FIELDS = {"unit_mass_i", "unit_volume_i"}
 
 
+# database columns holding the unit mass and unit volume of each type of resource
+UNIT_COLUMNS = {
+    ResourceType.discrete: ("unit_mass_i", "unit_volume_i"),
+    ResourceType.continuous: ("unit_mass_f", "unit_volume_f"),
+}
+
+
 def to_db_kwargs(resource: Resources) -> Dict[str, Any]:
-    excluded = {"unit_mass", "unit_volume"}
-    ret = {k: v for k, v in resource.dict().items() if k not in excluded}
-    suffix = "_i" if isinstance(resource, DiscreteResource) else "_f"
-    ret["unit_mass" + suffix] = resource.unit_mass
-    ret["unit_volume" + suffix] = resource.unit_volume
+    # the schemas are flat, so a shallow copy of the field values suffices
+    ret = resource.__dict__.copy()
+    mass_column, volume_column = UNIT_COLUMNS[resource.type]
+    ret[mass_column] = ret.pop("unit_mass")
+    ret[volume_column] = ret.pop("unit_volume")
     return ret
 
 
-def to_schema_kwargs(
-    db_model: Union[models.DiscreteResource, models.ContinuousResource]
-) -> Dict[str, Any]:
-    suffix = "_i" if isinstance(db_model, models.DiscreteResource) else "_f"
-    return {
-        "id": db_model.id,
-        "type": db_model.type,
-        "name": db_model.name,
-        "description": db_model.description,
-        "cos": db_model.cos,
-        "units": db_model.units,
-        "unit_mass": getattr(db_model, "unit_mass" + suffix),
-        "unit_volume": getattr(db_model, "unit_volume" + suffix),
-    }
+def to_read_dict(db_resource: models.Resource) -> Dict[str, Any]:
+    # rows keep their unit values in per-type columns, so validate the schema keyword
+    # arguments the row builds rather than reading the schema from the row's attributes
+    read_schema = MODEL_TO_READ_SCHEMA[type(db_resource)]
+    return read_schema.parse_obj(db_resource.to_schema_kwargs()).dict()
 
 
 @router.get(
@@ -59,9 +77,39 @@ def to_schema_kwargs(
     response_model=List[ReadResources],
     description="List resources currently in the database.",
 )
-def list_resources(db: Session = Depends(database.get_db)):
-    db_resources = db.query(models.Resource).all()
-    return [to_schema_kwargs(resource) for resource in db_resources]
+def list_resources(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[int] = None,
+    db: Session = Depends(database.get_db),
+):
+    db_resources = paginate(
+        db.query(models.Resource), models.Resource.id, skip, limit, after
+    )
+    return ORJSONResponse([to_read_dict(resource) for resource in db_resources])
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    description="Stream all resources in the database as newline-delimited JSON.",
+)
+def stream_resources(db: Session = Depends(database.get_db)):
+    def generate():
+        result = db.execute(
+            select(models.Resource)
+            .order_by(models.Resource.id)
+            .execution_options(stream_results=True, yield_per=500)
+        )
+        # starlette runs each step of a sync iterator in the threadpool, so send a whole
+        # partition of rows per step rather than a single line
+        for partition in result.scalars().partitions():
+            yield b"".join(
+                orjson.dumps(to_read_dict(resource)) + b"\n"
+                for resource in partition
+            )
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -69,14 +117,14 @@ def list_resources(db: Session = Depends(database.get_db)):
     response_model=ReadResources,
     description="Find a specific resource in the database.",
 )
-def read_resource(id_: int, db: Session = Depends(database.get_db)):
-    db_resource = db.query(models.Resource).get(id_)
+def read_resource(id_: int, request: Request, db: Session = Depends(database.get_db)):
+    db_resource = db.get(models.Resource, id_)
     if db_resource is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No resource found with id={id_}",
         )
-    return to_schema_kwargs(db_resource)
+    return conditional_response(request, to_read_dict(db_resource))
 
 
 @router.post(
@@ -90,7 +138,25 @@ def create_resource(resource: Resources, db: Session = Depends(database.get_db))
     db.add(db_resource)
     db.commit()
     db.refresh(db_resource)
-    return to_schema_kwargs(db_resource)
+    return ORJSONResponse(
+        to_read_dict(db_resource), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=List[ReadResources],
+    status_code=status.HTTP_201_CREATED,
+    description="Add several new resources to the database in one transaction.",
+)
+def create_resources(
+    resources: BulkResources = Body(...), db: Session = Depends(database.get_db)
+):
+    db_resources = [
+        SCHEMA_TO_MODEL[type(resource)](**to_db_kwargs(resource))
+        for resource in resources
+    ]
+    return create_all(db, db_resources, to_read_dict)
 
 
 @router.patch(
@@ -102,7 +168,7 @@ def create_resource(resource: Resources, db: Session = Depends(database.get_db))
 def patch_resource(
     id_: int, resource: UpdateResources, db: Session = Depends(database.get_db)
 ):
-    db_resource = db.query(models.Resource).get(id_)
+    db_resource = db.get(models.Resource, id_)
     if db_resource is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -115,14 +181,16 @@ def patch_resource(
             f"update "
             f"type to {resource.type} ",
         )
-    suffix = "_i" if resource.type == ResourceType.discrete else "_f"
+    mass_column, volume_column = UNIT_COLUMNS[resource.type]
     for field_name, field in resource.dict().items():
         if field_name != "type" and field is not None:
-            if field_name == "unit_mass" or field_name == "unit_volume":
-                field_name += suffix
+            if field_name == "unit_mass":
+                field_name = mass_column
+            elif field_name == "unit_volume":
+                field_name = volume_column
             setattr(db_resource, field_name, field)
     db.commit()
-    return to_schema_kwargs(db_resource)
+    return ORJSONResponse(to_read_dict(db_resource))
 
 
 @router.delete(
@@ -132,17 +200,13 @@ def patch_resource(
     description="Delete a resource from the database.",
 )
 def delete_resource(id_: int, db: Session = Depends(database.get_db)):
-    db_resource = db.query(models.Resource).get(id_)
+    db_resource = db.get(models.Resource, id_)
     if db_resource is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No resource found with id={id_}",
         )
-    suffix = "_i" if db_resource.type == ResourceType.discrete else "_f"
-    as_dict = dictify_row(db_resource)
+    as_dict = to_read_dict(db_resource)
     db.delete(db_resource)
     db.commit()
-    for field in ("unit_mass", "unit_volume"):
-        as_dict[field] = as_dict[field + suffix]
-        del as_dict[field + suffix]
-    return as_dict
+    return ORJSONResponse(as_dict)
@@ -0,0 +1,91 @@
+import hashlib
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from ..database import Base
+
+
+def to_response_dict(
+    read_schemas: Mapping[type, Type[BaseModel]], row: Base
+) -> Dict[str, Any]:
+    """
+    Serialize a row with the read schema of its class. Looking the schema up by the
+    row's class avoids having FastAPI try each member of a response union in turn.
+
+    :param read_schemas: mapping from each model class to its read schema
+    :param row: the row to serialize
+    :return: the row's fields, as validated by its read schema
+    """
+    return read_schemas[type(row)].from_orm(row).dict()
+
+
+def paginate(
+    query: Query, id_column: ColumnElement, skip: int, limit: int, after: Optional[int]
+) -> List[Base]:
+    """
+    Fetch one page of a query's rows in id order, either by offset or after a given id.
+
+    :param query: query for the rows to page through
+    :param id_column: the id column of the queried rows, which orders the pages
+    :param skip: number of rows to skip from the start; cannot be combined with after
+    :param limit: maximum number of rows to return
+    :param after: if given, return only rows whose id is greater than this
+    :return: the rows of the page
+    :raises HTTPException: with status 422 if both skip and after are given
+    """
+    query = query.order_by(id_column)
+    if after is not None:
+        if skip:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="skip and after cannot be combined",
+            )
+        query = query.filter(id_column > after)
+    else:
+        query = query.offset(skip)
+    return query.limit(limit).all()
+
+
+def create_all(
+    db: Session, rows: List[Base], to_dict: Callable[[Base], Dict[str, Any]]
+) -> ORJSONResponse:
+    """
+    Add rows to the database in one transaction and respond with their serialized forms.
+
+    :param db: session to add the rows with
+    :param rows: the new rows
+    :param to_dict: serializes one row for the response
+    :return: a 201 response listing the created rows
+    """
+    db.add_all(rows)
+    # flushing assigns ids, so the response is built without reloading each row
+    db.flush()
+    created = [to_dict(row) for row in rows]
+    db.commit()
+    return ORJSONResponse(created, status_code=status.HTTP_201_CREATED)
+
+
+def conditional_response(request: Request, content: Any) -> Response:
+    """
+    Serialize content as JSON tagged with an ETag, answering 304 Not Modified instead when
+    the request's If-None-Match header already names that tag.
+
+    :param request: incoming request, checked for an If-None-Match header
+    :param content: JSON-serializable content of the response
+    :return: the JSON response, or an empty 304 response if the client's copy is current
+    """
+    body = ORJSONResponse(content).body
+    etag = '"{}"'.format(hashlib.blake2b(body, digest_size=16).hexdigest())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # weak comparison, per RFC 7232 section 3.2
+        tags = {tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type=ORJSONResponse.media_type, headers=headers)
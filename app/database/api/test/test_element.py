@@ -37,7 +37,7 @@ from fastapi.testclient import TestClient
 from app.database.api.database import Base, get_db
 from app.database.api.main import app
 from app.database.api.models.element import Element as ElementModel
-from app.database.test.utilities import TestingSessionLocal, test_engine
+from app.database.test.utilities import rollback_session, test_engine
 from spacenet.schemas.element import ElementKind
 from spacenet.test.element_factories import *
 from .utilities import (filter_val_not_none, first_subset_second, make_subset, with_type)
@@ -49,16 +49,6 @@ client = TestClient(app)
 Base.metadata.create_all(bind=test_engine)
 
 
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-
 KIND_TO_FACTORIES: Dict[
     ElementKind, Tuple[Type[ValidArgsFactory], Type[InvalidArgsFactory]]
 ] = {
@@ -80,19 +70,23 @@ KIND_TO_FACTORIES: Dict[
 TESTED_VARIANTS: List[ElementKind] = [variant for variant in ElementKind]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="module", autouse=True)
 def element_routing():
+    ElementModel.__table__.drop(test_engine, checkfirst=True)
     ElementModel.__table__.create(test_engine)
-    random.seed("spacenet")
-    yield
-    ElementModel.__table__.drop(test_engine)
+
+
+@pytest.fixture
+def rng() -> random.Random:
+    return random.Random("spacenet")
 
 
 @pytest.fixture(autouse=True)
-def reseed_and_clear_tables():
-    ElementModel.__table__.drop(test_engine, checkfirst=False)
-    ElementModel.__table__.create(test_engine, checkfirst=True)
-    random.seed("spacenet")
+def roll_back():
+    with rollback_session() as db:
+        app.dependency_overrides[get_db] = lambda: db
+        yield
+        del app.dependency_overrides[get_db]
 
 
 @pytest.mark.parametrize("element_type", TESTED_VARIANTS)
@@ -107,14 +101,14 @@ def test_empty(element_type: ElementKind):
 
 
 @pytest.mark.parametrize("element_type", TESTED_VARIANTS)
-def test_create(element_type: ElementKind):
+def test_create(element_type: ElementKind, rng: random.Random):
     valid_factory, invalid_factory = KIND_TO_FACTORIES[element_type]
     # POST an invalid element: should 422
-    invalid_kw = invalid_factory.make_keywords()
+    invalid_kw = invalid_factory.make_keywords(rng)
     response = client.post("/element/", json=invalid_kw)
     assert response.status_code == 422
     # POST a valid element: should 201
-    valid_kw = with_type(valid_factory.make_keywords(), element_type)
+    valid_kw = with_type(valid_factory.make_keywords(rng), element_type)
     post_response = client.post("/element/", json=valid_kw)
     assert post_response.status_code == 201
     assert first_subset_second(valid_kw, post_response.json())
@@ -134,19 +128,21 @@ def test_create(element_type: ElementKind):
 
 
 @pytest.mark.parametrize("element_type", TESTED_VARIANTS)
-def test_update(element_type: ElementKind):
+def test_update(element_type: ElementKind, rng: random.Random):
     def check_get():
         get_r = client.get(f"/element/{id_}")
         assert get_r.status_code == 200
         assert expected_fields == get_r.json()
 
     valid_factory, invalid_factory = KIND_TO_FACTORIES[element_type]
-    kw = with_type(valid_factory.make_keywords(), element_type)
+    kw = with_type(valid_factory.make_keywords(rng), element_type)
     post_r = client.post("/element/", json=kw)
     assert post_r.status_code == 201
     id_ = post_r.json()["id"]
     # PATCH that element w/ valid inputs: should be a 200
-    patch_kw = with_type(make_subset(valid_factory.make_keywords()), element_type)
+    patch_kw = with_type(
+        make_subset(valid_factory.make_keywords(rng), rng), element_type
+    )
     patch_r = client.patch(f"/element/{id_}", json=patch_kw)
     assert patch_r.status_code == 200
     expected_fields = {**kw, **filter_val_not_none(patch_kw), "id": id_}
@@ -160,15 +156,15 @@ def test_update(element_type: ElementKind):
     # GET that element: should not have changed
     check_get()
     # PATCH the element with non-matching type but valid schema: should be a 409
-    other_type = random.choice(get_invalid_types(element_type))
+    other_type = rng.choice(get_invalid_types(element_type))
     valid_other, _ = KIND_TO_FACTORIES[other_type]
-    non_matching_kw = with_type(valid_other.make_keywords(), other_type)
+    non_matching_kw = with_type(valid_other.make_keywords(rng), other_type)
     bad_patch = client.patch(f"/element/{id_}", json=non_matching_kw)
     assert bad_patch.status_code == 409
     # GET that element: should not have changed
     check_get()
     # PATCH the element with invalid schema: should be a 422
-    invalid_kw = with_type(invalid_factory.make_keywords(), element_type)
+    invalid_kw = with_type(invalid_factory.make_keywords(rng), element_type)
     bad_patch = client.patch(f"/element/{id_}", json=invalid_kw)
     assert bad_patch.status_code == 422
     # GET that element: should not have changed
@@ -176,7 +172,7 @@ def test_update(element_type: ElementKind):
 
 
 @pytest.mark.parametrize("element_type", TESTED_VARIANTS)
-def test_delete(element_type: ElementKind):
+def test_delete(element_type: ElementKind, rng: random.Random):
     def check_get_all():
         read_all_r = client.get("/element/")
         assert read_all_r.status_code == 200
@@ -190,7 +186,7 @@ def test_delete(element_type: ElementKind):
     posted_vals = []
     for _ in range(num_posts):
         valid_factory, invalid_factory = KIND_TO_FACTORIES[element_type]
-        valid_kw = with_type(valid_factory.make_keywords(), element_type)
+        valid_kw = with_type(valid_factory.make_keywords(rng), element_type)
         post_r = client.post("/element/", json=valid_kw)
         assert post_r.status_code == 201
         assert first_subset_second(valid_kw, post_r.json())
@@ -1,18 +1,18 @@
 import json
+import pkgutil
 import random
 from enum import Enum
 from typing import List, Type
 
-import pkg_resources
 import pytest
 from fastapi.testclient import TestClient
 
 import spacenet
-from app.database.api.database import Base
+from app.database.api.database import Base, get_db
 from app.database.api.main import app
 from app.database.api.models.edge import Edge as EdgeModel
 from app.database.api.models.node import Node as NodeModel
-from app.database.test.utilities import TestingSessionLocal, test_engine
+from app.database.test.utilities import rollback_session, test_engine
 from spacenet.schemas.edge import EdgeType
 from spacenet.schemas.node import NodeType
 from .utilities import (
@@ -28,19 +28,19 @@ client = TestClient(app)
 Base.metadata.create_all(bind=test_engine)
 
 GOOD_NODE_LIST = json.loads(
-    pkg_resources.resource_string(spacenet.__name__, "test/good_nodes.json")
+    pkgutil.get_data(spacenet.__name__, "test/good_nodes.json")
 )
 
 BAD_NODE_LIST = json.loads(
-    pkg_resources.resource_string(spacenet.__name__, "test/bad_nodes.json")
+    pkgutil.get_data(spacenet.__name__, "test/bad_nodes.json")
 )
 
 GOOD_EDGE_LIST = json.loads(
-    pkg_resources.resource_string(spacenet.__name__, "test/good_edges.json")
+    pkgutil.get_data(spacenet.__name__, "test/good_edges.json")
 )
 
 BAD_EDGE_LIST = json.loads(
-    pkg_resources.resource_string(spacenet.__name__, "test/bad_edges.json")
+    pkgutil.get_data(spacenet.__name__, "test/bad_edges.json")
 )
 
 
@@ -48,14 +48,6 @@ def get_other_variants(to_exclude, enum: Type[Enum]) -> List[Enum]:
     return [variant.value for variant in enum if variant != to_exclude]
 
 
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 NODE_PREFIX = "/node"
 EDGE_PREFIX = "/edge"
 
@@ -72,14 +64,23 @@ NAMES_TO_VARIANTS = {
     **{str(variant): variant for variant in EDGE_VARIANTS},
 }
 
-GOOD_NODES = {
-    variant.value: [obj for obj in GOOD_NODE_LIST if obj["type"] == variant.value]
-    for variant in NODE_VARIANTS
-}
-GOOD_EDGES = {
-    variant.value: [obj for obj in GOOD_EDGE_LIST if obj["type"] == variant.value]
-    for variant in EDGE_VARIANTS
-}
+
+def group_by_type(objects: List[dict], variants: List[Enum]) -> dict:
+    """
+    Group test objects by the value of their "type" field in a single pass.
+
+    :param objects: test objects, each with a "type" field naming one of variants
+    :param variants: the variants to group by
+    :return: map from each variant's value to the objects of that type, in input order
+    """
+    grouped = {variant.value: [] for variant in variants}
+    for obj in objects:
+        grouped[obj["type"]].append(obj)
+    return grouped
+
+
+GOOD_NODES = group_by_type(GOOD_NODE_LIST, NODE_VARIANTS)
+GOOD_EDGES = group_by_type(GOOD_EDGE_LIST, EDGE_VARIANTS)
 
 
 def name_to_obj(name):
@@ -102,23 +103,21 @@ VARIANT_NAME_TO_PREFIX = {
 }
 
 
-@pytest.fixture(scope="module")
-def seed_and_make_tables():
-    random.seed("spacenet")
+@pytest.fixture(scope="module", autouse=True)
+def make_tables():
+    EdgeModel.__table__.drop(test_engine, checkfirst=True)
+    NodeModel.__table__.drop(test_engine, checkfirst=True)
     NodeModel.__table__.create(test_engine)
     EdgeModel.__table__.create(test_engine)
-    yield
-    NodeModel.__table__.drop(test_engine)
-    EdgeModel.__table__.drop(test_engine)
 
 
 @pytest.fixture(autouse=True)
-def reseed_and_clear_tables():
+def reseed_and_roll_back():
     random.seed("spacenet")
-    EdgeModel.__table__.drop(test_engine, checkfirst=False)
-    NodeModel.__table__.drop(test_engine)
-    EdgeModel.__table__.create(test_engine, checkfirst=True)
-    NodeModel.__table__.create(test_engine)
+    with rollback_session() as db:
+        app.dependency_overrides[get_db] = lambda: db
+        yield
+        del app.dependency_overrides[get_db]
 
 
 @pytest.mark.parametrize(
@@ -136,6 +135,48 @@ def test_empty(prefix):
     assert read_response.status_code == 404
 
 
+@pytest.mark.parametrize(
+    "prefix",
+    [
+        pytest.param(NODE_PREFIX, marks=pytest.mark.node),
+        pytest.param(EDGE_PREFIX, marks=pytest.mark.edge),
+    ],
+)
+@pytest.mark.parametrize(
+    "params", [{"limit": 0}, {"limit": -1}, {"skip": -1}, {"skip": 1, "after": 1}]
+)
+def test_list_out_of_bounds(prefix, params):
+    assert client.get(prefix, params=params).status_code == 422
+
+
+@pytest.mark.parametrize(
+    "prefix, good_list, bad_list",
+    [
+        pytest.param(
+            NODE_PREFIX, GOOD_NODE_LIST, BAD_NODE_LIST, marks=pytest.mark.node
+        ),
+        pytest.param(
+            EDGE_PREFIX, GOOD_EDGE_LIST, BAD_EDGE_LIST, marks=pytest.mark.edge
+        ),
+    ],
+)
+def test_bulk_create(prefix, good_list, bad_list):
+    bad_response = client.post(
+        f"{prefix}/bulk", json=good_list + [random.choice(bad_list)]
+    )
+    assert bad_response.status_code == 422
+    assert client.get(f"{prefix}/").json() == []
+    post_response = client.post(f"{prefix}/bulk", json=good_list)
+    assert post_response.status_code == 201
+    created = post_response.json()
+    assert len(created) == len(good_list)
+    for good_val, created_val in zip(good_list, created):
+        assert first_subset_second(good_val, created_val)
+    read_all_response = client.get(f"{prefix}/", params={"limit": len(good_list)})
+    assert read_all_response.status_code == 200
+    assert read_all_response.json() == created
+
+
 @pytest.mark.parametrize(
     "variant_name",
     [
@@ -2,6 +2,7 @@
 Contains integration tests where CRUD operations are exercised with resources, methodologically
 similar to element routing testing. Same restrictions on sequential runs only apply.
 """
+import json
 from typing import Dict, List, Tuple
 
 import pytest
@@ -10,7 +11,7 @@ from fastapi.testclient import TestClient
 from app.database.api.database import Base, get_db
 from app.database.api.main import app
 from app.database.api.models.resource import Resource as ResourceModel
-from app.database.test.utilities import TestingSessionLocal, test_engine
+from app.database.test.utilities import rollback_session, test_engine
 from spacenet.schemas.resource import ResourceType
 from .utilities import (
     filter_val_not_none,
@@ -26,16 +27,6 @@ client = TestClient(app)
 Base.metadata.create_all(bind=test_engine)
 
 
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-
 VALID_DISCRETE_ARGS = {
     "name": "foo",
     "cos": 1,
@@ -93,17 +84,18 @@ KIND_TO_ARGS: Dict[ResourceType, Tuple[Dict, Dict, Dict, Dict]] = {
 TESTED_VARIANTS: List[ResourceType] = [ResourceType.discrete, ResourceType.continuous]
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="module", autouse=True)
 def resource_routing():
+    ResourceModel.__table__.drop(test_engine, checkfirst=True)
     ResourceModel.__table__.create(test_engine)
-    yield
-    ResourceModel.__table__.drop(test_engine)
 
 
 @pytest.fixture(autouse=True)
-def clear_tables():
-    ResourceModel.__table__.drop(test_engine, checkfirst=False)
-    ResourceModel.__table__.create(test_engine, checkfirst=True)
+def roll_back():
+    with rollback_session() as db:
+        app.dependency_overrides[get_db] = lambda: db
+        yield
+        del app.dependency_overrides[get_db]
 
 
 @pytest.mark.parametrize("resource_type", TESTED_VARIANTS)
@@ -210,5 +202,79 @@ def test_delete(resource_type: ResourceType):
     assert len(read_all_r.json()) == 0
 
 
+def test_list_pagination():
+    posted_ids = []
+    for resource_type in TESTED_VARIANTS:
+        first, second, _, _ = KIND_TO_ARGS[resource_type]
+        for kw in (first, second):
+            post_r = client.post("/resource/", json=kw)
+            assert post_r.status_code == 201
+            posted_ids.append(post_r.json()["id"])
+    page_r = client.get("/resource/", params={"limit": 2})
+    assert page_r.status_code == 200
+    assert [v["id"] for v in page_r.json()] == posted_ids[:2]
+    page_r = client.get("/resource/", params={"skip": 1, "limit": 2})
+    assert page_r.status_code == 200
+    assert [v["id"] for v in page_r.json()] == posted_ids[1:3]
+    page_r = client.get("/resource/", params={"after": posted_ids[1]})
+    assert page_r.status_code == 200
+    assert [v["id"] for v in page_r.json()] == posted_ids[2:]
+    too_large_r = client.get("/resource/", params={"limit": 1001})
+    assert too_large_r.status_code == 422
+    negative_limit_r = client.get("/resource/", params={"limit": -1})
+    assert negative_limit_r.status_code == 422
+    negative_skip_r = client.get("/resource/", params={"skip": -1})
+    assert negative_skip_r.status_code == 422
+    both_r = client.get("/resource/", params={"skip": 1, "after": posted_ids[0]})
+    assert both_r.status_code == 422
+
+
+def test_read_etag():
+    first, second, _, _ = KIND_TO_ARGS[ResourceType.discrete]
+    id_ = client.post("/resource/", json=first).json()["id"]
+    read_r = client.get(f"/resource/{id_}")
+    assert read_r.status_code == 200
+    etag = read_r.headers["etag"]
+    cached_r = client.get(f"/resource/{id_}", headers={"If-None-Match": etag})
+    assert cached_r.status_code == 304
+    assert cached_r.content == b""
+    assert cached_r.headers["etag"] == etag
+    client.patch(f"/resource/{id_}", json=second)
+    stale_r = client.get(f"/resource/{id_}", headers={"If-None-Match": etag})
+    assert stale_r.status_code == 200
+    assert stale_r.headers["etag"] != etag
+    assert first_subset_second(second, stale_r.json())
+
+
+def test_bulk_create():
+    good_vals = [KIND_TO_ARGS[resource_type][0] for resource_type in TESTED_VARIANTS]
+    bad_r = client.post("/resource/bulk", json=good_vals + [INVALID_DISCRETE_ARGS])
+    assert bad_r.status_code == 422
+    assert client.get("/resource/").json() == []
+    post_r = client.post("/resource/bulk", json=good_vals)
+    assert post_r.status_code == 201
+    created = post_r.json()
+    assert len(created) == len(good_vals)
+    for kw, created_val in zip(good_vals, created):
+        assert first_subset_second(kw, created_val)
+    assert client.get("/resource/").json() == created
+
+
+def test_stream():
+    empty_r = client.get("/resource/stream")
+    assert empty_r.status_code == 200
+    assert empty_r.text == ""
+    posted_vals = []
+    for resource_type in TESTED_VARIANTS:
+        first, _, _, _ = KIND_TO_ARGS[resource_type]
+        post_r = client.post("/resource/", json=first)
+        assert post_r.status_code == 201
+        posted_vals.append(post_r.json())
+    stream_r = client.get("/resource/stream")
+    assert stream_r.status_code == 200
+    assert stream_r.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in stream_r.text.splitlines()] == posted_vals
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,15 +1,16 @@
 import random
-from typing import Dict
+from typing import Dict, Optional
 
 
 def with_type(d: Dict, kind) -> Dict:
     return {**d, "type": kind}
 
 
-def make_subset(d: Dict) -> Dict:
+def make_subset(d: Dict, rng: Optional[random.Random] = None) -> Dict:
+    draw = (rng or random).random
     ret = d.copy()
     for field in d:
-        if random.random() < 0.25:
+        if draw() < 0.25:
             del ret[field]
     return ret
 
@@ -1,6 +1,6 @@
 import unittest
 import json
-import pkg_resources
+import pkgutil
 import pytest
 
 from spacenet import test
@@ -24,7 +24,7 @@ class TestEdgeData(unittest.TestCase):
 
     def test_model_good_edges(self):
         edge_data = json.loads(
-            pkg_resources.resource_string(
+            pkgutil.get_data(
                 test.__name__,
                 'good_edges.json'
             )
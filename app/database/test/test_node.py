@@ -1,6 +1,6 @@
 import unittest
 import json
-import pkg_resources
+import pkgutil
 import pytest
 from sqlalchemy.orm import sessionmaker
 
@@ -25,7 +25,7 @@ class TestNodeData(unittest.TestCase):
 
     def test_model_good_nodes(self):
         nodes_data = json.loads(
-            pkg_resources.resource_string(
+            pkgutil.get_data(
                 test.__name__,
                 'good_nodes.json'
             )
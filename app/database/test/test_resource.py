@@ -1,6 +1,6 @@
 import unittest
 import json
-import pkg_resources
+import pkgutil
 import pytest
 
 from spacenet import test
@@ -23,7 +23,7 @@ class TestResource(unittest.TestCase):
 
     def test_model_good_example_data(self):
         resource_data = json.loads(
-            pkg_resources.resource_string(
+            pkgutil.get_data(
                 test.__name__,
                 'resource_data.json'
             )
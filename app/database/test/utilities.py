@@ -1,4 +1,6 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 TEST_DB_URL = "sqlite:///./test.db"
@@ -6,3 +8,43 @@ TEST_DB_URL = "sqlite:///./test.db"
 test_engine = create_engine(TEST_DB_URL, connect_args={"check_same_thread": False})
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+# pysqlite manages transactions itself and breaks SAVEPOINT handling, so let SQLAlchemy
+# emit BEGIN instead
+@event.listens_for(test_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine, "begin")
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+@contextmanager
+def rollback_session():
+    """
+    Provide a single session for a whole test, bound to one connection whose outer
+    transaction is rolled back on exit. Commits made through the session only release a
+    SAVEPOINT, which is immediately reopened, so nothing a test writes is persisted.
+
+    :return: context manager yielding the session
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = TestingSessionLocal(bind=connection)
+    nested = connection.begin_nested()
+
+    @event.listens_for(session, "after_transaction_end")
+    def restart_savepoint(session_, transaction_):
+        nonlocal nested
+        if not nested.is_active:
+            nested = connection.begin_nested()
+
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
@@ -2,10 +2,12 @@
 This module contains general-purpose mixins for generating common single behaviors which might
 be useful across different schema modules.
 """
+import copy
 from abc import ABC
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model, validator
+from pydantic.errors import NoneIsNotAllowedError
 
 __all__ = [
     "RequiresID",
@@ -26,6 +28,11 @@ class RequiresID(BaseModel, ABC):
 class OptionalFields(BaseModel, ABC):
     """
     A mixin which makes a subset of the fields of its subclasses optional.
+
+    The optional fields are declared afresh as Optional with a default of None, so pydantic
+    builds their validators itself rather than having already-prepared fields patched.
+    An optional field may be omitted, but an explicit null is still rejected unless the
+    field was already nullable.
     """
 
     def __init_subclass__(cls, **kwargs):
@@ -34,15 +41,43 @@ class OptionalFields(BaseModel, ABC):
             f"required_fields must be a subset " f"of the existing fields"
         )
         super().__init_subclass__()
-        optional_fields = (
-            field
-            for fieldName, field in cls.__fields__.items()
-            if fieldName not in excluded_fields
+        optional_fields = {}
+        non_nullable_fields = []
+        for field_name, field in cls.__fields__.items():
+            if field_name not in excluded_fields:
+                if not field.allow_none:
+                    non_nullable_fields.append(field_name)
+                field_info = copy.copy(field.field_info)
+                field_info.default = None
+                # constraints are already part of the field's constrained type
+                for constraint in field_info.get_constraints():
+                    setattr(field_info, constraint, None)
+                optional_fields[field_name] = (Optional[field.outer_type_], field_info)
+        if not optional_fields:
+            return
+        validators = {}
+        if non_nullable_fields:
+            validators["reject_none"] = validator(
+                *non_nullable_fields, pre=True, allow_reuse=True
+            )(_reject_none)
+        # the generated subclass excludes every field, so it returns above
+        optional_model = create_model(
+            cls.__name__,
+            __base__=cls,
+            __module__=cls.__module__,
+            __cls_kwargs__={"excluded_fields": set(cls.__fields__)},
+            __validators__=validators,
+            **optional_fields,
         )
-        for field in optional_fields:
-            field.default = None
-            field.outer_type_ = Optional
-            field.required = False
+        # updated in place because the metaclass builds the class signature from this
+        # same dict once __init_subclass__ returns
+        cls.__fields__.update(optional_model.__fields__)
+
+
+def _reject_none(cls, value):
+    if value is None:
+        raise NoneIsNotAllowedError()
+    return value
 
 
 class RequiresOnlyType(OptionalFields):
@@ -52,7 +87,8 @@ class RequiresOnlyType(OptionalFields):
     """
 
     def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(excluded_fields={"type"}, **kwargs)
+        kwargs.setdefault("excluded_fields", {"type"})
+        super().__init_subclass__(**kwargs)
 
 
 class ReadSchema(RequiresID):
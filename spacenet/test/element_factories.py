@@ -1,5 +1,5 @@
 import random
-from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any, Dict, Tuple
 
 from spacenet.constants import Environment
@@ -12,6 +12,15 @@ NON_NEG_FLOATS = [i / 2 for i in range(10)]
 NEG_FLOATS = [float(-1 * i) for i in range(1, 10)]
 FLOATS_IN_UNIT_INTERVAL = [i / 9 for i in range(10)]
 
+_ENV_VALUES = tuple(variant.value for variant in Environment)
+_ENV_VALUES_STR = tuple(map(str, _ENV_VALUES))
+_ENV_VALUES_STR_SET = frozenset(_ENV_VALUES_STR)
+# strings which are not environments, even if Environment gains new values
+_INVALID_ENV = tuple(s for s in STRINGS if s not in _ENV_VALUES_STR_SET)
+_INVALID_TYPES = {
+    kind: tuple(other for other in ElementKind if other != kind) for kind in ElementKind
+}
+
 __all__ = [
     "get_invalid_types",
     "ValidElementArgsFactory",
@@ -41,52 +50,57 @@ def get_invalid_types(my_type: ElementKind) -> Tuple[ElementKind, ...]:
     :param my_type: the valid type discriminant
     :return:  all invalid type discriminants
     """
-    return tuple(kind for kind in ElementKind if kind != my_type)
+    return _INVALID_TYPES[my_type]
 
 
-def with_id(kw: Dict) -> Dict:
+def with_id(kw: Dict, rng: random.Random) -> Dict:
     """
     Construct a new dictionary which adds a field "id_" with a value of type uuid to the
     provided dictionary.
 
     :param kw: input dictionary
+    :param rng: random number generator to draw the ID from
     :return: copy of input dictionary with new field "id_"
     """
-    return {**kw, "id_": int(random.random() * 5000)}
+    return {**kw, "id_": int(rng.random() * 5000)}
 
 
-class ValidArgsFactory(ABC):
+class ValidArgsFactory:
     """
     Interface defining behavior of a keyword argument factory which provides valid keyword
     arguments.
     """
 
+    __slots__ = ()
+
     @staticmethod
-    @abstractmethod
-    def make_keywords() -> Dict[str, Any]:
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
         """
         Make valid keyword arguments for constructing an element model.
 
+        :param rng: random number generator to draw values from
         :return: the resulting keyword argument dictionary
         """
-        pass
+        raise NotImplementedError
 
 
-class InvalidArgsFactory(ABC):
+class InvalidArgsFactory:
     """
     Interface defining behavior of a keyword argument factory which provides invalid keyword
     arguments.
     """
 
+    __slots__ = ()
+
     @staticmethod
-    @abstractmethod
-    def make_keywords() -> Dict[str, Any]:
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
         """
         Make invalid keyword arguments for constructing an element model.
 
+        :param rng: random number generator to draw values from
         :return: the resulting keyword argument dictionary
         """
-        pass
+        raise NotImplementedError
 
 
 class ValidElementArgsFactory(ValidArgsFactory):
@@ -95,26 +109,40 @@ class ValidElementArgsFactory(ValidArgsFactory):
     an element model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     validNames = STRINGS
     validDescs = STRINGS
     validCoS = list(range(11))
-    validEnvironments = [str(variant.value) for variant in Environment]
+    validEnvironments = _ENV_VALUES_STR
     validAccMasses = NON_NEG_INTS + NON_NEG_FLOATS
     validMasses = NON_NEG_INTS + NON_NEG_FLOATS
     validVolumes = validMasses
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = {
-            "name": random.choice(ValidElementArgsFactory.validNames),
-            "description": random.choice(ValidElementArgsFactory.validDescs),
-            "class_of_supply": random.choice(ValidElementArgsFactory.validCoS),
-            "environment": random.choice(ValidElementArgsFactory.validEnvironments),
-            "accommodation_mass": random.choice(ValidElementArgsFactory.validAccMasses),
-            "mass": random.choice(ValidElementArgsFactory.validMasses),
-            "volume": random.choice(ValidElementArgsFactory.validVolumes),
-        }
-        return kw
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        return make_element_keywords(rng)
+
+
+def make_element_keywords(rng: random.Random) -> Dict[str, Any]:
+    """
+    Make valid keyword arguments for the fields every element has. The other valid factories
+    add their own fields to the result, so a new element field is only drawn here.
+
+    :param rng: random number generator to draw values from
+    :return: the resulting keyword argument dictionary
+    """
+    choice = rng.choice
+    element = ValidElementArgsFactory
+    return {
+        "name": choice(element.validNames),
+        "description": choice(element.validDescs),
+        "class_of_supply": choice(element.validCoS),
+        "environment": choice(element.validEnvironments),
+        "accommodation_mass": choice(element.validAccMasses),
+        "mass": choice(element.validMasses),
+        "volume": choice(element.validVolumes),
+    }
 
 
 class InvalidElementArgsFactory(InvalidArgsFactory):
@@ -123,13 +151,15 @@ class InvalidElementArgsFactory(InvalidArgsFactory):
     arguments for constructing an element model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     invalidNames = []
     badlyTypedNames = []
     invalidDescs = []
     badlyTypedDescs = []
     invalidCoS = list(range(11, 99))
     badlyTypedCoS = STRINGS
-    invalidEnvironments = STRINGS
+    invalidEnvironments = _INVALID_ENV
     badlyTypedEnvironments = NON_NEG_INTS + NON_NEG_FLOATS
     invalidAccMasses = NEG_INTS + NEG_FLOATS
     badlyTypedAccMasses = STRINGS
@@ -137,67 +167,80 @@ class InvalidElementArgsFactory(InvalidArgsFactory):
     badlyTypedMasses = STRINGS
     invalidVolumes = invalidMasses
     badlyTypedVolumes = badlyTypedMasses
+    # set once the class is defined, from get_options below
+    fieldOptions: Tuple[Tuple[str, Tuple[tuple, ...]], ...]
+    fieldNames: Tuple[str, ...]
+    invalidFieldOptions: Tuple[Tuple[str, Tuple[tuple, ...]], ...]
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
         """
         Make invalid or badly-typed keyword arguments for constructing an element model.
 
+        :param rng: random number generator to draw values from
         :return: the resulting keyword argument dictionary
 
         This implementation first randomly checks if an attribute should be given an invalid
         value, and if said process assigns no invalid values, selects exactly 1 attribute to
         have an invalid value.
         """
+        choice = rng.choice
+        randrange = rng.randrange
         invalid_selected = 0
-        attrs = [
-            "Names",
-            "Descs",
-            "CoS",
-            "Environments",
-            "AccMasses",
-            "Masses",
-            "Volumes",
-        ]
-        field_names = [
-            "name",
-            "description",
-            "class_of_supply",
-            "environment",
-            "accommodation_mass",
-            "mass",
-            "volume",
-        ]
-        kw = {}
-        for attr, field_name in zip(attrs, field_names):
-            options = InvalidElementArgsFactory.get_options(attr)
-            ix = random.randrange(len(options))
+        kw = dict.fromkeys(InvalidElementArgsFactory.fieldNames)
+        for field_name, options in InvalidElementArgsFactory.fieldOptions:
+            ix = randrange(len(options))
             if ix != 0:
                 invalid_selected += 1
             option = options[ix]
-            attr_value = random.choice(option)
+            attr_value = choice(option)
             kw[field_name] = attr_value
         if invalid_selected == 0:
-            bad_attr_ix = random.randrange(
-                2, len(attrs)
-            )  # exclude name and description
-            attr, field_name = attrs[bad_attr_ix], field_names[bad_attr_ix]
-            options = InvalidElementArgsFactory.get_options(attr)[
-                1:
-            ]  # exclude first valid
-            option = random.choice(options)
-            attr_value = random.choice(option)
+            field_name, options = choice(InvalidElementArgsFactory.invalidFieldOptions)
+            option = choice(options)
+            attr_value = choice(option)
             kw[field_name] = attr_value
         return kw
 
-    @staticmethod
-    def get_options(attr: str) -> list:
-        options = [
-            getattr(ValidElementArgsFactory, f"valid{attr}"),
-            getattr(InvalidElementArgsFactory, f"badlyTyped{attr}"),
-            getattr(InvalidElementArgsFactory, f"invalid{attr}"),
-        ]
-        return [opt for opt in options if len(opt) > 0]
+
+@lru_cache(maxsize=None)
+def get_options(attr: str) -> Tuple[tuple, ...]:
+    """
+    Get the non-empty option lists for an element attribute, valid options first.
+
+    :param attr: attribute suffix shared by the factories' option lists, such as "Masses"
+    :return: the valid, badly-typed, and invalid options for the attribute, as tuples
+    """
+    options = (
+        getattr(ValidElementArgsFactory, f"valid{attr}"),
+        getattr(InvalidElementArgsFactory, f"badlyTyped{attr}"),
+        getattr(InvalidElementArgsFactory, f"invalid{attr}"),
+    )
+    return tuple(tuple(opt) for opt in options if opt)
+
+
+# the options for each field, valid options first, gathered once rather than per call
+InvalidElementArgsFactory.fieldOptions = tuple(
+    (field_name, get_options(attr))
+    for attr, field_name in (
+        ("Names", "name"),
+        ("Descs", "description"),
+        ("CoS", "class_of_supply"),
+        ("Environments", "environment"),
+        ("AccMasses", "accommodation_mass"),
+        ("Masses", "mass"),
+        ("Volumes", "volume"),
+    )
+)
+InvalidElementArgsFactory.fieldNames = tuple(
+    field_name for field_name, _ in InvalidElementArgsFactory.fieldOptions
+)
+# the options for fields which can be made invalid (all but name and description), without
+# their valid options
+InvalidElementArgsFactory.invalidFieldOptions = tuple(
+    (field_name, options[1:])
+    for field_name, options in InvalidElementArgsFactory.fieldOptions[2:]
+)
 
 
 class ValidCargoCarrierArgsFactory(ValidArgsFactory):
@@ -206,55 +249,65 @@ class ValidCargoCarrierArgsFactory(ValidArgsFactory):
     constructing a resource container or element carrier model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     validMaxCargoMass = NON_NEG_FLOATS + [None]
     validMaxCargoVolume = NON_NEG_FLOATS + [None]
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = ValidElementArgsFactory.make_keywords()
-        kw["max_cargo_mass"] = random.choice(
-            ValidCargoCarrierArgsFactory.validMaxCargoMass
-        )
-        kw["max_cargo_volume"] = random.choice(
-            ValidCargoCarrierArgsFactory.validMaxCargoVolume
-        )
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        kw = make_element_keywords(rng)
+        kw.update(make_cargo_keywords(rng))
         return kw
 
 
+def make_cargo_keywords(rng: random.Random) -> Dict[str, Any]:
+    """
+    Make valid keyword arguments for the cargo capacity fields shared by every element which
+    carries cargo.
+
+    :param rng: random number generator to draw values from
+    :return: the resulting keyword argument dictionary
+    """
+    choice = rng.choice
+    cargo = ValidCargoCarrierArgsFactory
+    return {
+        "max_cargo_mass": choice(cargo.validMaxCargoMass),
+        "max_cargo_volume": choice(cargo.validMaxCargoVolume),
+    }
+
+
 class InvalidCargoCarrierArgsFactory(InvalidArgsFactory):
     """
     Factory class for constructing dictionaries consisting of invalid arguments for
     constructing a resource container or element carrier model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     invalidMaxCargoMass = NEG_INTS + NEG_FLOATS
     badlyTypedMaxCargoMass = STRINGS
+    allBadMaxCargoMass = tuple(invalidMaxCargoMass + badlyTypedMaxCargoMass)
     invalidMaxCargoVolume = NEG_INTS + NEG_FLOATS
     badlyTypedMaxCargoVolume = STRINGS
+    allBadMaxCargoVolume = tuple(invalidMaxCargoVolume + badlyTypedMaxCargoVolume)
+    # pairs of option lists indexed by two random bits: both fields are invalid a quarter
+    # of the time, and only one of them is otherwise
+    optionTable = (
+        (allBadMaxCargoMass, allBadMaxCargoVolume),
+        (allBadMaxCargoMass, ValidCargoCarrierArgsFactory.validMaxCargoVolume),
+        (ValidCargoCarrierArgsFactory.validMaxCargoMass, allBadMaxCargoVolume),
+        (ValidCargoCarrierArgsFactory.validMaxCargoMass, allBadMaxCargoVolume),
+    )
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = ValidCargoCarrierArgsFactory.make_keywords()
-        rand = random.random()
-        if rand < 0.25:
-            kw["max_cargo_mass"] = random.choice(
-                InvalidCargoCarrierArgsFactory.invalidMaxCargoMass
-                + InvalidCargoCarrierArgsFactory.badlyTypedMaxCargoMass
-            )
-            kw["max_cargo_volume"] = random.choice(
-                InvalidCargoCarrierArgsFactory.invalidMaxCargoVolume
-                + InvalidCargoCarrierArgsFactory.badlyTypedMaxCargoVolume
-            )
-        elif rand < 0.5:
-            kw["max_cargo_mass"] = random.choice(
-                InvalidCargoCarrierArgsFactory.invalidMaxCargoMass
-                + InvalidCargoCarrierArgsFactory.badlyTypedMaxCargoMass
-            )
-        else:
-            kw["max_cargo_volume"] = random.choice(
-                InvalidCargoCarrierArgsFactory.invalidMaxCargoVolume
-                + InvalidCargoCarrierArgsFactory.badlyTypedMaxCargoVolume
-            )
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        kw = ValidCargoCarrierArgsFactory.make_keywords(rng)
+        mass_options, volume_options = InvalidCargoCarrierArgsFactory.optionTable[
+            rng.getrandbits(2)
+        ]
+        kw["max_cargo_mass"] = rng.choice(mass_options)
+        kw["max_cargo_volume"] = rng.choice(volume_options)
         return kw
 
 
@@ -264,12 +317,13 @@ class ValidElementCarrierArgsFactory(ValidArgsFactory):
     constructing a element carrier model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = ValidCargoCarrierArgsFactory.make_keywords()
-        kw["cargo_environment"] = random.choice(
-            [variant.value for variant in Environment]
-        )
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        kw = make_element_keywords(rng)
+        kw.update(make_cargo_keywords(rng))
+        kw["cargo_environment"] = rng.choice(_ENV_VALUES)
         return kw
 
 
@@ -279,17 +333,21 @@ class InvalidElementCarrierArgsFactory(InvalidArgsFactory):
     constructing an element carrier model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     invalidCargoEnvironments = ["Foo", "Bar", "Baz"]
     badlyTypedCargoEnvironments = list(range(10))
+    allBadCargoEnvironments = tuple(
+        invalidCargoEnvironments + badlyTypedCargoEnvironments
+    )
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = random.choice(
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        kw = rng.choice(
             (ValidCargoCarrierArgsFactory, InvalidCargoCarrierArgsFactory)
-        ).make_keywords()
-        kw["cargo_environment"] = random.choice(
-            InvalidElementCarrierArgsFactory.invalidCargoEnvironments
-            + InvalidElementCarrierArgsFactory.badlyTypedCargoEnvironments
+        ).make_keywords(rng)
+        kw["cargo_environment"] = rng.choice(
+            InvalidElementCarrierArgsFactory.allBadCargoEnvironments
         )
         return kw
 
@@ -300,13 +358,18 @@ class ValidAgentArgsFactory(ValidArgsFactory):
     constructing an agent model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     validTImeFractions = FLOATS_IN_UNIT_INTERVAL
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = ValidElementArgsFactory.make_keywords()
-        kw["active_time_fraction"] = random.choice(
-            ValidAgentArgsFactory.validTImeFractions
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        choice = rng.choice
+        kw = make_element_keywords(rng)
+        kw.update(
+            {
+                "active_time_fraction": choice(ValidAgentArgsFactory.validTImeFractions),
+            }
         )
         return kw
 
@@ -317,19 +380,21 @@ class InvalidAgentArgsFactory(InvalidArgsFactory):
     constructing an agent model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     invalidTimeFractions = (
         NEG_INTS + NEG_FLOATS + [x for x in NON_NEG_FLOATS + NON_NEG_INTS if x > 1]
     )
     badlyTypedTimeFractions = STRINGS
+    allBadTimeFractions = tuple(invalidTimeFractions + badlyTypedTimeFractions)
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = random.choice(
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        kw = rng.choice(
             (ValidElementArgsFactory, InvalidElementArgsFactory)
-        ).make_keywords()
-        kw["active_time_fraction"] = random.choice(
-            InvalidAgentArgsFactory.invalidTimeFractions
-            + InvalidAgentArgsFactory.badlyTypedTimeFractions
+        ).make_keywords(rng)
+        kw["active_time_fraction"] = rng.choice(
+            InvalidAgentArgsFactory.allBadTimeFractions
         )
         return kw
 
@@ -340,59 +405,69 @@ class ValidVehicleArgsFactory(ValidArgsFactory):
     constructing a vehicle model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     validMaxFuels = NON_NEG_INTS + NON_NEG_FLOATS
     validMaxCrews = NON_NEG_INTS
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = ValidCargoCarrierArgsFactory.make_keywords()
-        kw["max_crew"] = random.choice(ValidVehicleArgsFactory.validMaxCrews)
-        kw["max_fuel"] = random.choice(ValidVehicleArgsFactory.validMaxFuels)
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        kw = make_element_keywords(rng)
+        kw.update(make_cargo_keywords(rng))
+        kw.update(make_vehicle_keywords(rng))
         return kw
 
 
+def make_vehicle_keywords(rng: random.Random) -> Dict[str, Any]:
+    """
+    Make valid keyword arguments for the crew and fuel fields shared by every vehicle. The
+    cargo fields are drawn separately by make_cargo_keywords.
+
+    :param rng: random number generator to draw values from
+    :return: the resulting keyword argument dictionary
+    """
+    choice = rng.choice
+    vehicle = ValidVehicleArgsFactory
+    return {
+        "max_crew": choice(vehicle.validMaxCrews),
+        "max_fuel": choice(vehicle.validMaxFuels),
+    }
+
+
 class InvalidVehicleArgsFactory(InvalidArgsFactory):
     """
     Factory class for constructing dictionaries consisting of invalid arguments for
     constructing a vehicle model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     invalidMaxFuels = NEG_INTS + NEG_FLOATS
     badlyTypedMaxFuels = STRINGS
+    allBadMaxFuels = tuple(invalidMaxFuels + badlyTypedMaxFuels)
     invalidMaxCrews = NEG_INTS + NEG_FLOATS
     badlyTypedMaxCrews = STRINGS
+    allBadMaxCrews = tuple(invalidMaxCrews + badlyTypedMaxCrews)
+    # pairs of option lists indexed by two random bits: both fields are invalid a quarter
+    # of the time, and only one of them is otherwise
+    optionTable = (
+        (allBadMaxFuels, allBadMaxCrews),
+        (allBadMaxFuels, ValidVehicleArgsFactory.validMaxCrews),
+        (ValidVehicleArgsFactory.validMaxFuels, allBadMaxCrews),
+        (ValidVehicleArgsFactory.validMaxFuels, allBadMaxCrews),
+    )
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = random.choice(
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        choice = rng.choice
+        kw = choice(
             (ValidCargoCarrierArgsFactory, InvalidCargoCarrierArgsFactory)
-        ).make_keywords()
-        rand = random.random()
-        if rand < 0.25:
-            max_fuel_options = (
-                InvalidVehicleArgsFactory.invalidMaxFuels
-                + InvalidVehicleArgsFactory.badlyTypedMaxFuels
-            )
-            max_crew_options = (
-                InvalidVehicleArgsFactory.invalidMaxCrews
-                + InvalidVehicleArgsFactory.badlyTypedMaxCrews
-            )
-        elif rand < 0.5:
-            max_fuel_options = (
-                InvalidVehicleArgsFactory.invalidMaxFuels
-                + InvalidVehicleArgsFactory.badlyTypedMaxFuels
-            )
-            max_crew_options = ValidVehicleArgsFactory.validMaxCrews
-
-        else:
-            max_fuel_options = ValidVehicleArgsFactory.validMaxFuels
-            max_crew_options = (
-                InvalidVehicleArgsFactory.invalidMaxCrews
-                + InvalidVehicleArgsFactory.badlyTypedMaxCrews
-            )
-
-        kw["max_crew"] = random.choice(max_crew_options)
-        kw["max_fuel"] = random.choice(max_fuel_options)
+        ).make_keywords(rng)
+        max_fuel_options, max_crew_options = InvalidVehicleArgsFactory.optionTable[
+            rng.getrandbits(2)
+        ]
+        kw["max_crew"] = choice(max_crew_options)
+        kw["max_fuel"] = choice(max_fuel_options)
         return kw
 
 
@@ -402,14 +477,23 @@ class ValidPropulsiveArgsFactory(ValidArgsFactory):
     constructing a propulsive vehicle model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     validISPs = NON_NEG_INTS + NON_NEG_FLOATS
     validPropIDs = NON_NEG_INTS + NEG_INTS
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = ValidVehicleArgsFactory.make_keywords()
-        kw["isp"] = random.choice(ValidPropulsiveArgsFactory.validISPs)
-        kw["propellant_id"] = random.choice(ValidPropulsiveArgsFactory.validPropIDs)
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        choice = rng.choice
+        kw = make_element_keywords(rng)
+        kw.update(make_cargo_keywords(rng))
+        kw.update(make_vehicle_keywords(rng))
+        kw.update(
+            {
+                "isp": choice(ValidPropulsiveArgsFactory.validISPs),
+                "propellant_id": choice(ValidPropulsiveArgsFactory.validPropIDs),
+            }
+        )
         return kw
 
 
@@ -419,40 +503,34 @@ class InvalidPropulsiveArgsFactory(InvalidArgsFactory):
     constructing a propulsive vehicle model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     invalidISPs = NEG_INTS + NEG_FLOATS
     badlyTypedISPs = STRINGS
+    allBadISPs = tuple(invalidISPs + badlyTypedISPs)
     invalidPropIDs = NEG_FLOATS + NON_NEG_FLOATS
     badlyTypedPropIDs = STRINGS
+    allBadPropIDs = tuple(invalidPropIDs + badlyTypedPropIDs)
+    # pairs of option lists indexed by two random bits: both fields are invalid a quarter
+    # of the time, and only one of them is otherwise
+    optionTable = (
+        (allBadISPs, allBadPropIDs),
+        (allBadISPs, ValidPropulsiveArgsFactory.validPropIDs),
+        (ValidPropulsiveArgsFactory.validISPs, allBadPropIDs),
+        (ValidPropulsiveArgsFactory.validISPs, allBadPropIDs),
+    )
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = random.choice(
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        choice = rng.choice
+        kw = choice(
             (ValidVehicleArgsFactory, InvalidVehicleArgsFactory)
-        ).make_keywords()
-        rand = random.random()
-        if rand < 0.25:
-            isp_options = (
-                InvalidPropulsiveArgsFactory.invalidISPs
-                + InvalidPropulsiveArgsFactory.badlyTypedISPs
-            )
-            propellant_id_options = (
-                InvalidPropulsiveArgsFactory.invalidPropIDs
-                + InvalidPropulsiveArgsFactory.badlyTypedPropIDs
-            )
-        elif rand < 0.5:
-            isp_options = (
-                InvalidPropulsiveArgsFactory.invalidISPs
-                + InvalidPropulsiveArgsFactory.badlyTypedISPs
-            )
-            propellant_id_options = ValidPropulsiveArgsFactory.validPropIDs
-        else:
-            isp_options = ValidPropulsiveArgsFactory.validISPs
-            propellant_id_options = (
-                InvalidPropulsiveArgsFactory.invalidPropIDs
-                + InvalidPropulsiveArgsFactory.badlyTypedPropIDs
-            )
-        kw["isp"] = random.choice(isp_options)
-        kw["propellant_id"] = random.choice(propellant_id_options)
+        ).make_keywords(rng)
+        isp_options, propellant_id_options = InvalidPropulsiveArgsFactory.optionTable[
+            rng.getrandbits(2)
+        ]
+        kw["isp"] = choice(isp_options)
+        kw["propellant_id"] = choice(propellant_id_options)
         return kw
 
 
@@ -462,14 +540,23 @@ class ValidSurfaceArgsFactory(ValidArgsFactory):
     constructing a surface vehicle model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     validMaxSpeeds = NON_NEG_INTS + NON_NEG_FLOATS
     validFuelIDs = NON_NEG_INTS + NEG_INTS
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = ValidVehicleArgsFactory.make_keywords()
-        kw["max_speed"] = random.choice(ValidSurfaceArgsFactory.validMaxSpeeds)
-        kw["fuel_id"] = random.choice(ValidSurfaceArgsFactory.validFuelIDs)
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        choice = rng.choice
+        kw = make_element_keywords(rng)
+        kw.update(make_cargo_keywords(rng))
+        kw.update(make_vehicle_keywords(rng))
+        kw.update(
+            {
+                "max_speed": choice(ValidSurfaceArgsFactory.validMaxSpeeds),
+                "fuel_id": choice(ValidSurfaceArgsFactory.validFuelIDs),
+            }
+        )
         return kw
 
 
@@ -479,38 +566,32 @@ class InvalidSurfaceArgsFactory(InvalidArgsFactory):
     constructing a surface vehicle model, excepting the "type" field.
     """
 
+    __slots__ = ()
+
     invalidMaxSpeeds = NEG_INTS + NEG_FLOATS
     badlyTypedMaxSpeeds = STRINGS
+    allBadMaxSpeeds = tuple(invalidMaxSpeeds + badlyTypedMaxSpeeds)
     invalidFuelIDs = []
     badlyTypedFuelIDs = STRINGS
+    allBadFuelIDs = tuple(invalidFuelIDs + badlyTypedFuelIDs)
+    # pairs of option lists indexed by two random bits: both fields are invalid a quarter
+    # of the time, and only one of them is otherwise
+    optionTable = (
+        (allBadMaxSpeeds, allBadFuelIDs),
+        (allBadMaxSpeeds, ValidSurfaceArgsFactory.validFuelIDs),
+        (ValidSurfaceArgsFactory.validMaxSpeeds, allBadFuelIDs),
+        (ValidSurfaceArgsFactory.validMaxSpeeds, allBadFuelIDs),
+    )
 
     @staticmethod
-    def make_keywords() -> Dict[str, Any]:
-        kw = random.choice(
+    def make_keywords(rng: random.Random) -> Dict[str, Any]:
+        choice = rng.choice
+        kw = choice(
             (ValidVehicleArgsFactory, InvalidVehicleArgsFactory)
-        ).make_keywords()
-        rand = random.random()
-        if rand < 0.25:
-            max_speed_options = (
-                InvalidSurfaceArgsFactory.invalidMaxSpeeds
-                + InvalidSurfaceArgsFactory.badlyTypedMaxSpeeds
-            )
-            fuel_id_options = (
-                InvalidSurfaceArgsFactory.invalidFuelIDs
-                + InvalidSurfaceArgsFactory.badlyTypedFuelIDs
-            )
-        elif rand < 0.5:
-            max_speed_options = (
-                InvalidSurfaceArgsFactory.invalidMaxSpeeds
-                + InvalidSurfaceArgsFactory.badlyTypedMaxSpeeds
-            )
-            fuel_id_options = ValidSurfaceArgsFactory.validFuelIDs
-        else:
-            max_speed_options = ValidSurfaceArgsFactory.validMaxSpeeds
-            fuel_id_options = (
-                InvalidSurfaceArgsFactory.invalidFuelIDs
-                + InvalidSurfaceArgsFactory.badlyTypedFuelIDs
-            )
-        kw["max_speed"] = random.choice(max_speed_options)
-        kw["fuel_id"] = random.choice(fuel_id_options)
+        ).make_keywords(rng)
+        max_speed_options, fuel_id_options = InvalidSurfaceArgsFactory.optionTable[
+            rng.getrandbits(2)
+        ]
+        kw["max_speed"] = choice(max_speed_options)
+        kw["fuel_id"] = choice(fuel_id_options)
         return kw
@@ -1,7 +1,7 @@
 import json
+import pkgutil
 import unittest
 
-import pkg_resources
 import pytest
 from pydantic import ValidationError
 
@@ -73,7 +73,7 @@ class TestEdge(unittest.TestCase):
 class TestFromFile(unittest.TestCase):
 
     good_edges = json.loads(
-        pkg_resources.resource_string(test.__name__, "good_edges.json")
+        pkgutil.get_data(test.__name__, "good_edges.json")
     )
 
     good_surface = list(
@@ -87,7 +87,7 @@ class TestFromFile(unittest.TestCase):
     )
 
     bad_edges = json.loads(
-        pkg_resources.resource_string(test.__name__, "bad_edges.json")
+        pkgutil.get_data(test.__name__, "bad_edges.json")
     )
 
     def test_FlightEdge(self):
@@ -2,10 +2,9 @@
 This module contains tests for the element model and schema. The tests are organized as
 follows:
 
-Each type of element, T, has its own tester class Test{T}.
-These tester classes are what's actually run by the unittest framework, while
-they're backed by supporting factory classes and non-instantiated tester superclasses which
-handle configuration.
+Each type of element, T, has its own ElementSpec in ELEMENT_SPECS, and every test function is
+parametrized over those specs. The specs are backed by supporting factory classes which
+generate keyword arguments.
 
 For each T, a factory class is used to generate valid and invalid keyword arguments to the
 constructor of that type. Each tester class verifies that a) when all fields are valid,
@@ -29,18 +28,19 @@ adding a more manual test for that specific combination is still feasible.
 
 Reproducing a failure is possible because the seed is deterministically generated: the tests
 failing once should be repeatable each time, as the same sequence of values is always produced.
+Each test draws from its own generator, so tests share no random state and can run in any
+order or in parallel across processes, e.g. with pytest-xdist: `pytest -n auto spacenet`.
 
-The BaseTester class handles most of the testing logic, while factories handle their respective
+The test functions handle most of the testing logic, while factories handle their respective
 keyword argument generation logic. Changing schema attributes constitutes removing them from
-a tester class (or its superclass)'s attributes, and making the factory no longer assign the
-value in the dictionary.
+a spec's attributes, and making the factory no longer assign the value in the dictionary.
 """
 import random
-import unittest
-from typing import Tuple, Type
+from itertools import cycle
+from typing import List, NamedTuple, Sequence, Tuple, Type
 
 import pytest
-from pydantic import ValidationError
+from pydantic import ValidationError, validate_model
 
 from spacenet.schemas.element import *
 from spacenet.schemas.element import (
@@ -53,183 +53,193 @@ NUM_ATTEMPTS = 500
 SEED = "spacenet"
 
 
-class BaseTester:
-    """
-    The base testing class. This class handles verifying that a model has values matching
-    the keyword arguments which instantiated it, as well as that the model fails to validate
-    when invalid values or an invalid type discriminant is provided. This is a mixin, so any
-    uses will also have to inherit from unittest.TestCase at some point.
-    """
+NON_ENUM_ATTRS = ("name", "description", "accommodation_mass", "mass", "volume")
+ENUM_ATTRS = ("class_of_supply", "environment")
+CARRIER_NON_ENUM_ATTRS = NON_ENUM_ATTRS + ("max_cargo_mass", "max_cargo_volume")
+AGENT_NON_ENUM_ATTRS = NON_ENUM_ATTRS + ("active_time_fraction",)
+VEHICLE_NON_ENUM_ATTRS = NON_ENUM_ATTRS + ("max_crew",)
 
-    # Should be set by subclasses
-    validType: ElementKind
-    invalidTypes: Tuple[ElementKind, ...]
-    validFactory = None  # factory to use for successfully constructing models
-    invalidFactory = None  # factory to use for unsuccessfully constructing models
-    nonEnumAttrs = ["name", "description", "accommodation_mass", "mass", "volume"]
-    # the attribute names which are not enumerations
-    enumAttrs = ["class_of_supply", "environment"]
-    elementType: Type[Element]
 
-    # the attribute names which are enumerations
-
-    def assert_matches(self, kw: dict, element: Element) -> None:
-        """
-        Verify that the fields of the provided Element match the corresponding values in the
-        provided keyword argument dictionary which created it.
-
-        :param kw: keyword argument dictionary which created element
-        :param element: the element to check the fields of
-
-        This implementation uses getattr for using non-literal values when accessing attributes
-        to avoid code duplication.
-        """
-        for nonEnumAttr in self.nonEnumAttrs:
-            if nonEnumAttr in kw:
-                self.assertEqual(
-                    kw[nonEnumAttr],
-                    getattr(element, nonEnumAttr),
-                    msg=f"Expected element.{nonEnumAttr} = {kw[nonEnumAttr]},"
-                    f"but was {getattr(element, nonEnumAttr)}",
-                )
-        for enumAttr in self.enumAttrs:
-            if str(enumAttr) in kw:
-                self.assertEqual(
-                    kw[enumAttr],
-                    getattr(element, enumAttr).value,
-                    msg=f"Expected element.{enumAttr}.value = {kw[enumAttr]},"
-                    f"but was {getattr(element, enumAttr).value}",
-                )
-        self.assertEqual(
-            self.validType,
-            element.type,
-            msg=f"Expected element.type to be {self.validType}",
-        )
-
-    def test_all_valid(self) -> None:
-        """
-        Verify that, when all fields are valid, no error is raised when constructing a model
-        from keyword arguments, and that all fields match what is expected.
-        """
-        factory = self.validFactory()
-        for _ in range(NUM_ATTEMPTS):
-            kw = factory.make_keywords()
-            kw["type"] = self.validType
-            element = self.elementType(**kw)
-            self.assert_matches(kw, element)
-
-    def test_missing_fields(self):
-        factory = self.validFactory()
-        for _ in range(NUM_ATTEMPTS):
-            kw = factory.make_keywords()
-            kw["type"] = self.validType
-            missing_field, _ = kw.popitem()
-            with self.assertRaises(
-                ValidationError, msg=f"provided keywords are missing {missing_field}"
-            ):
-                self.elementType(**kw)
-
-    def test_invalid_values(self) -> None:
-        """
-        Verify that, when at least one field takes on an invalid value, an error is raised when
-        constructing a model from keyword arguments.
-        """
-        factory = self.invalidFactory()
-        for _ in range(NUM_ATTEMPTS):
-            kw = factory.make_keywords()
-            kw["type"] = self.validType
-            with self.assertRaises(
-                ValidationError, msg=f"{kw} should have raised an error"
-            ):
-                self.elementType(**kw)
-
-    def test_invalid_type(self) -> None:
-        """
-        Verify that, when the type discriminant of an element does not match what it's expected
-        to, validation fails.
-        """
-        factory = self.validFactory()
-        kw = factory.make_keywords()
-        for type_ in self.invalidTypes:
-            kw["type"] = type_
-            with self.assertRaises(
-                ValidationError,
-                msg=f"{kw} should have raised an error for wrong discriminant",
-            ):
-                self.elementType(**kw)
-
-
-class SeededTester(unittest.TestCase):
+class ElementSpec(NamedTuple):
     """
-    Base testing class which, on setup, resets its random seed to a constant.
+    Configuration for testing one type of element.
     """
 
-    def setUp(self) -> None:
-        random.seed(SEED)
-
-
-class TestElement(SeededTester, BaseTester):
-    validType = ElementKind.Element
-    invalidTypes = get_invalid_types(my_type=validType)
-    validFactory = ValidElementArgsFactory
-    invalidFactory = InvalidElementArgsFactory
-    elementType = Element
-
-
-class TestResourceContainer(SeededTester, BaseTester):
-    validType = ElementKind.ResourceContainer
-    invalidTypes = get_invalid_types(my_type=validType)
-    validFactory = ValidCargoCarrierArgsFactory
-    invalidFactory = InvalidCargoCarrierArgsFactory
-    nonEnumAttrs = BaseTester.nonEnumAttrs + ["max_cargo_mass", "max_cargo_volume"]
-    elementType = ResourceContainer
-
-
-class TestElementCarrier(SeededTester, BaseTester):
-    validType = ElementKind.ElementCarrier
-    invalidTypes = get_invalid_types(my_type=validType)
-    validFactory = ValidElementCarrierArgsFactory
-    invalidFactory = InvalidCargoCarrierArgsFactory
-    nonEnumAttrs = TestResourceContainer.nonEnumAttrs
-    enumAttrs = BaseTester.enumAttrs + ["cargo_environment"]
-    elementType = ElementCarrier
-
-
-class AgentTester(BaseTester):
-    validFactory = ValidAgentArgsFactory
-    invalidFactory = InvalidAgentArgsFactory
-    nonEnumAttrs = BaseTester.nonEnumAttrs + ["active_time_fraction"]
+    elementType: Type[Element]
+    validType: ElementKind
+    validFactory: Type[ValidArgsFactory]  # factory for successfully constructing models
+    invalidFactory: Type[InvalidArgsFactory]  # factory for unsuccessfully constructing models
+    # (attribute name, whether it is an enumeration) for each compared attribute
+    comparePlan: Tuple[Tuple[str, bool], ...]
+
+
+def make_spec(
+    elementType: Type[Element],
+    validType: ElementKind,
+    validFactory: Type[ValidArgsFactory],
+    invalidFactory: Type[InvalidArgsFactory],
+    nonEnumAttrs: Sequence[str] = NON_ENUM_ATTRS,
+    enumAttrs: Sequence[str] = ENUM_ATTRS,
+) -> ElementSpec:
+    comparePlan = tuple((attr, False) for attr in nonEnumAttrs) + tuple(
+        (attr, True) for attr in enumAttrs
+    )
+    return ElementSpec(elementType, validType, validFactory, invalidFactory, comparePlan)
+
+
+ELEMENT_SPECS: List[ElementSpec] = [
+    make_spec(
+        Element,
+        ElementKind.Element,
+        ValidElementArgsFactory,
+        InvalidElementArgsFactory,
+    ),
+    make_spec(
+        ResourceContainer,
+        ElementKind.ResourceContainer,
+        ValidCargoCarrierArgsFactory,
+        InvalidCargoCarrierArgsFactory,
+        nonEnumAttrs=CARRIER_NON_ENUM_ATTRS,
+    ),
+    make_spec(
+        ElementCarrier,
+        ElementKind.ElementCarrier,
+        ValidElementCarrierArgsFactory,
+        InvalidCargoCarrierArgsFactory,
+        nonEnumAttrs=CARRIER_NON_ENUM_ATTRS,
+        enumAttrs=ENUM_ATTRS + ("cargo_environment",),
+    ),
+    make_spec(
+        HumanAgent,
+        ElementKind.HumanAgent,
+        ValidAgentArgsFactory,
+        InvalidAgentArgsFactory,
+        nonEnumAttrs=AGENT_NON_ENUM_ATTRS,
+    ),
+    make_spec(
+        RoboticAgent,
+        ElementKind.RoboticAgent,
+        ValidAgentArgsFactory,
+        InvalidAgentArgsFactory,
+        nonEnumAttrs=AGENT_NON_ENUM_ATTRS,
+    ),
+    make_spec(
+        PropulsiveVehicle,
+        ElementKind.Propulsive,
+        ValidPropulsiveArgsFactory,
+        InvalidPropulsiveArgsFactory,
+        nonEnumAttrs=VEHICLE_NON_ENUM_ATTRS + ("max_fuel", "isp"),
+    ),
+    make_spec(
+        SurfaceVehicle,
+        ElementKind.Surface,
+        ValidSurfaceArgsFactory,
+        InvalidSurfaceArgsFactory,
+        nonEnumAttrs=VEHICLE_NON_ENUM_ATTRS + ("max_fuel", "max_speed"),
+    ),
+]
+
+parametrize_specs = pytest.mark.parametrize(
+    "spec", ELEMENT_SPECS, ids=lambda spec: spec.elementType.__name__
+)
 
 
-class TestHumanAgent(SeededTester, AgentTester):
-    validType = ElementKind.HumanAgent
-    invalidTypes = get_invalid_types(my_type=validType)
-    elementType = HumanAgent
+@pytest.fixture
+def rng() -> random.Random:
+    return random.Random(SEED)
 
 
-class TestRoboticAgent(SeededTester, AgentTester):
-    validType = ElementKind.RoboticAgent
-    invalidTypes = get_invalid_types(my_type=validType)
-    elementType = RoboticAgent
+def assert_matches(spec: ElementSpec, kw: dict, element: Element) -> None:
+    """
+    Verify that the fields of the provided Element match the corresponding values in the
+    provided keyword argument dictionary which created it.
 
+    :param spec: configuration of the element's type
+    :param kw: keyword argument dictionary which created element
+    :param element: the element to check the fields of
 
-class VehicleTester(BaseTester):
-    nonEnumAttrs = BaseTester.nonEnumAttrs + ["max_crew"]
+    This implementation gathers the compared fields in one pass over the spec's comparison
+    plan and checks them in a single comparison, whose failure message already diffs the
+    mismatched fields. The factories always provide every compared field.
+    """
+    expected = {}
+    actual = {}
+    # field values live in the instance __dict__, so read them without attribute lookup
+    values = element.__dict__
+    for attr, is_enum in spec.comparePlan:
+        expected[attr] = kw[attr]
+        value = values[attr]
+        actual[attr] = value.value if is_enum else value
+    assert expected == actual
+    assert element.type == spec.validType, f"Expected element.type to be {spec.validType}"
+
+
+@parametrize_specs
+def test_all_valid(spec: ElementSpec, rng: random.Random) -> None:
+    """
+    Verify that, when all fields are valid, no error is raised when constructing a model
+    from keyword arguments, and that all fields match what is expected.
+    """
+    # resolve the factory method and model class once rather than on every attempt
+    make_keywords = spec.validFactory().make_keywords
+    element_type = spec.elementType
+    for _ in range(NUM_ATTEMPTS):
+        kw = make_keywords(rng)
+        kw["type"] = spec.validType
+        element = element_type(**kw)
+        assert_matches(spec, kw, element)
+
+
+@parametrize_specs
+def test_missing_fields(spec: ElementSpec, rng: random.Random) -> None:
+    """
+    Verify that, when any one field is missing, validation fails. The missing field cycles
+    through every field in turn.
+    """
+    make_keywords = spec.validFactory().make_keywords
+    element_type = spec.elementType
+    missing_fields = cycle((*make_keywords(rng), "type"))
+    for _ in range(NUM_ATTEMPTS):
+        kw = make_keywords(rng)
+        kw["type"] = spec.validType
+        missing_field = next(missing_fields)
+        kw = {k: v for k, v in kw.items() if k != missing_field}
+        _, _, error = validate_model(element_type, kw)
+        assert isinstance(
+            error, ValidationError
+        ), f"provided keywords are missing {missing_field}"
+
+
+@parametrize_specs
+def test_invalid_values(spec: ElementSpec, rng: random.Random) -> None:
+    """
+    Verify that, when at least one field takes on an invalid value, an error is raised when
+    constructing a model from keyword arguments.
 
+    Validation errors are collected with validate_model, which is what model construction
+    runs, so no model or exception is built for each of the expected failures.
+    """
+    make_keywords = spec.invalidFactory().make_keywords
+    element_type = spec.elementType
+    for _ in range(NUM_ATTEMPTS):
+        kw = make_keywords(rng)
+        kw["type"] = spec.validType
+        _, _, error = validate_model(element_type, kw)
+        assert isinstance(error, ValidationError), f"{kw} should have raised an error"
 
-class TestPropulsiveVehicle(SeededTester, VehicleTester):
-    validType = ElementKind.Propulsive
-    invalidTypes = get_invalid_types(my_type=validType)
-    validFactory = ValidPropulsiveArgsFactory
-    invalidFactory = InvalidPropulsiveArgsFactory
-    nonEnumAttrs = VehicleTester.nonEnumAttrs + ["max_fuel", "isp"]
-    elementType = PropulsiveVehicle
 
+@parametrize_specs
+def test_invalid_type(spec: ElementSpec, rng: random.Random) -> None:
+    """
+    Verify that, when the type discriminant of an element does not match what it's expected
+    to, validation fails.
 
-class TestSurfaceVehicle(SeededTester, VehicleTester):
-    validType = ElementKind.Surface
-    invalidTypes = get_invalid_types(my_type=validType)
-    validFactory = ValidSurfaceArgsFactory
-    invalidFactory = InvalidSurfaceArgsFactory
-    nonEnumAttrs = VehicleTester.nonEnumAttrs + ["max_fuel", "max_speed"]
-    elementType = SurfaceVehicle
+    Each wrong type is validated with an otherwise-valid set of fields through
+    validate_model, so no model is built for the expected failures.
+    """
+    kw = spec.validFactory().make_keywords(rng)
+    for type_ in get_invalid_types(my_type=spec.validType):
+        _, _, error = validate_model(spec.elementType, {**kw, "type": type_})
+        assert isinstance(
+            error, ValidationError
+        ), f"{type_} should have been rejected as the type of {spec.elementType.__name__}"
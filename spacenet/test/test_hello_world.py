@@ -1,6 +1,6 @@
 import unittest
 import json
-import pkg_resources
+import pkgutil
 import pytest
 
 from spacenet.schemas.hello_world import HelloWorld
@@ -28,7 +28,7 @@ class TestHelloWorld(unittest.TestCase):
 
     def test_good_example_data(self):
         messages = json.loads(
-            pkg_resources.resource_string(
+            pkgutil.get_data(
                 __name__,
                 'hello_world_data.json'
             )
@@ -38,7 +38,7 @@ class TestHelloWorld(unittest.TestCase):
 
     def test_bad_example_data(self):
         messages = json.loads(
-            pkg_resources.resource_string(
+            pkgutil.get_data(
                 __name__,
                 'hello_world_data.json'
             )
@@ -3,11 +3,12 @@ This module contains tests for mixins defined, and checks that the behavior of t
 compose more specific mixins (such as RequiresOnlyType) is correct. Uses simple equivalence
 partitions.
 """
-import copy
+import inspect
 import unittest
+from typing import Optional
 
 import pytest
-from pydantic import BaseModel, Field, conint
+from pydantic import BaseModel, Field, ValidationError, conint
 from pydantic.fields import ModelField
 
 from spacenet.schemas.mixins import OptionalFields, RequiresID
@@ -27,18 +28,31 @@ class TestOptionalFields(unittest.TestCase):
         b: float = Field(description="test")
         c: conint(ge=0)
 
+    class ExpectedOptionalModel(BaseModel):
+        a: Optional[int] = None
+        b: Optional[float] = Field(None, description="test")
+        c: Optional[conint(ge=0)] = None
     
     def test_all_made_optional(self):
         class OptionalModel(self.Model, OptionalFields):
             pass
 
-        for field_name, field in self.Model.__fields__.items():
-            exp_field = copy.deepcopy(field)
-            exp_field.required = False
-            exp_field.default = None
+        for field_name in self.Model.__fields__:
+            exp_field = self.ExpectedOptionalModel.__fields__[field_name]
             actual_field = OptionalModel.__fields__[field_name]
             # using repr b/c __eq__ isn't implemented for Field
             self.assertEqual(repr(exp_field), repr(actual_field))
+        self.assertEqual("test", OptionalModel.__fields__["b"].field_info.description)
+        self.assertIsNone(OptionalModel().c)
+        # compared as strings b/c each conint call creates a distinct type
+        self.assertEqual(
+            str(inspect.signature(self.ExpectedOptionalModel)),
+            str(inspect.signature(OptionalModel)),
+        )
+        with self.assertRaises(ValidationError):
+            OptionalModel(c=None)
+        with self.assertRaises(ValidationError):
+            OptionalModel(c=-1)
 
     
     def test_some_made_optional(self):
@@ -50,10 +64,7 @@ class TestOptionalFields(unittest.TestCase):
             for field_name in set(self.Model.__fields__.keys()).difference({"a"})
         )
         for field_name in optional_fields:
-            field = self.Model.__fields__[field_name]
-            exp_field = copy.deepcopy(field)
-            exp_field.required = False
-            exp_field.default = None
+            exp_field = self.ExpectedOptionalModel.__fields__[field_name]
             actual_field = PartialOptionalModel.__fields__[field_name]
             self.assertEqual(repr(exp_field), repr(actual_field))
         self.assertEqual(
@@ -2,173 +2,207 @@ import pytest
 
 from spacenet.schemas.node import LagrangeNode, OrbitalNode, SurfaceNode, NodeType
 
-import unittest
-import json
-import pkg_resources
-from pydantic import ValidationError
+import pkgutil
+import warnings
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Sequence, Tuple, Type
+
+import pydantic
+from pydantic import BaseModel, ValidationError, validate_model
 
 from spacenet.schemas import node as nos
 from spacenet import test
 
+try:
+    from orjson import loads
+except ImportError:  # orjson comes with the app, not with spacenet itself
+    from json import loads
+
 pytestmark = [pytest.mark.unit, pytest.mark.node]
 
+# these tests construct many models, which is markedly slower with pure-Python pydantic
+# (pydantic 2 has no such flag, as its core is always compiled)
+if not getattr(pydantic, "compiled", True):
+    warnings.warn(
+        "pydantic is not compiled; install it from a binary wheel for faster tests",
+        RuntimeWarning,
+    )
 
-class TestNode(unittest.TestCase):
+# parsed once per interpreter rather than in each test class body, and shared by the
+# tests as tuples so that no test can change another's inputs
+_GOOD_NODES = tuple(loads(pkgutil.get_data(test.__name__, "good_nodes.json")))
+_BAD_NODES = tuple(loads(pkgutil.get_data(test.__name__, "bad_nodes.json")))
+
+
+def _split_by_type(nodes: Sequence[dict]) -> Dict[str, Tuple[dict, ...]]:
+    """
+    Group node dictionaries by their type discriminant in a single pass.
+
+    :param nodes: node dictionaries, each with a "type" key
+    :return: the nodes of each type, keyed by the value of every NodeType
+    """
+    by_type: Dict[str, List[dict]] = {node_type.value: [] for node_type in NodeType}
+    for node in nodes:
+        by_type[node["type"]].append(node)
+    return {node_type: tuple(group) for node_type, group in by_type.items()}
+
+
+_GOOD_BY_TYPE = _split_by_type(_GOOD_NODES)
+
+# getters for the checked fields of each node type, from a model and from a dictionary,
+# so that each check is a single tuple comparison
+_SURFACE_FIELDS = ("name", "description", "body_1", "type", "latitude", "longitude")
+_SURFACE_ATTRS = attrgetter(*_SURFACE_FIELDS)
+_SURFACE_ITEMS = itemgetter(*_SURFACE_FIELDS)
+_ORBITAL_FIELDS = (
+    "name",
+    "description",
+    "body_1",
+    "type",
+    "apoapsis",
+    "periapsis",
+    "inclination",
+)
+_ORBITAL_ATTRS = attrgetter(*_ORBITAL_FIELDS)
+_ORBITAL_ITEMS = itemgetter(*_ORBITAL_FIELDS)
+_LAGRANGE_FIELDS = ("name", "description", "body_1", "type", "body_2", "lp_number")
+_LAGRANGE_ATTRS = attrgetter(*_LAGRANGE_FIELDS)
+_LAGRANGE_ITEMS = itemgetter(*_LAGRANGE_FIELDS)
+
+
+def _validated_values(model: Type[BaseModel], node: dict) -> dict:
+    """
+    Validate a node dictionary as the given model, without constructing the model.
+
+    :param model: the model class to validate against
+    :param node: the node dictionary which should be accepted
+    :return: the validated field values
+    """
+    values, _, error = validate_model(model, node)
+    assert error is None, f"{node} should be a valid {model.__name__}: {error}"
+    return values
+
+
+def _assert_rejects(model: Type[BaseModel], node: dict) -> None:
+    """
+    Assert that a node dictionary fails validation as the given model.
+
+    :param model: the model class to validate against
+    :param node: the node dictionary which should be rejected
+
+    This implementation only runs validate_model, which is what model construction runs,
+    so neither a model nor an exception is built for the expected failure.
+    """
+    _, _, error = validate_model(model, node)
+    assert isinstance(
+        error, ValidationError
+    ), f"{node} should not be a valid {model.__name__}"
+
+
+# inputs of the hand-written node tests, built once
+_SUR_GOOD = {
+    "name": "KSC",
+    "description": "Kennedy Space Center",
+    "type": "Surface",
+    "body_1": "Earth",
+    "latitude": 28.57,
+    "longitude": -80.65,
+}
+_SUR_BAD = {
+    "name": "KSC",
+    "description": "Kennedy Space Center",
+    "type": "Orbital",
+    "body_1": "Earth",
+    "latitude": 28.57,
+    "longitude": -80.65,
+}
+_ORB_GOOD = {
+    "name": "LEO",
+    "description": "Low Earth Orbit",
+    "body_1": "Earth",
+    "apoapsis": 296,
+    "periapsis": 296,
+    "inclination": 28.5,
+    "type": "Orbital",
+}
+_ORB_BAD = {
+    "name": "LEO",
+    "description": "Low Earth Orbit",
+    "body_1": "Saturn",
+    "apoapsis": -100,
+    "periapsis": -100,
+    "inclination": -100,
+    "type": "Orbital",
+}
+_LAG_GOOD = {
+    "name": "EM L5",
+    "description": "Earth-Moon Lagrange point 5",
+    "body_1": "Earth",
+    "body_2": "Moon",
+    "lp_number": 5,
+    "type": "Lagrange",
+}
+_LAG_BAD = {
+    "name": "LEO",
+    "description": "Low Earth Orbit",
+    "body_1": "Saturn",
+    "apoapsis": -100,
+    "periapsis": -100,
+    "body_2": "Titan",
+    "lp_number": 6,
+    "type": "Lagrange",
+}
+
+
+class TestNode:
     def testSurNode(self):
-        goodData = {
-            "name": "KSC",
-            "description": "Kennedy Space Center",
-            "type": "Surface",
-            "body_1": "Earth",
-            "latitude": 28.57,
-            "longitude": -80.65,
-        }
-        badData = {
-            "name": "KSC",
-            "description": "Kennedy Space Center",
-            "type": "Orbital",
-            "body_1": "Earth",
-            "latitude": 28.57,
-            "longitude": -80.65,
-        }
-        goodNode = SurfaceNode(**goodData)
-        self.assertEqual(goodNode.name, goodData.get("name"))
-        self.assertEqual(goodNode.description, goodData.get("description"))
-        self.assertEqual(goodNode.type, goodData.get("type"))
-        self.assertEqual(goodNode.body_1, goodData.get("body_1"))
-        self.assertEqual(goodNode.latitude, goodData.get("latitude"))
-        self.assertEqual(goodNode.longitude, goodData.get("longitude"))
-
-        with self.assertRaises(ValidationError):
-            badNode = SurfaceNode(**badData)
+        goodNode = SurfaceNode.parse_obj(_SUR_GOOD)
+        assert _SURFACE_ATTRS(goodNode) == _SURFACE_ITEMS(_SUR_GOOD)
 
-    def testOrbNode(self):
-        goodData = {
-            "name": "LEO",
-            "description": "Low Earth Orbit",
-            "body_1": "Earth",
-            "apoapsis": 296,
-            "periapsis": 296,
-            "inclination": 28.5,
-            "type": "Orbital",
-        }
-        badData = {
-            "name": "LEO",
-            "description": "Low Earth Orbit",
-            "body_1": "Saturn",
-            "apoapsis": -100,
-            "periapsis": -100,
-            "inclination": -100,
-            "type": "Orbital",
-        }
-        goodNode = OrbitalNode(**goodData)
-        self.assertEqual(goodNode.name, goodData.get("name"))
-        self.assertEqual(goodNode.description, goodData.get("description"))
-        self.assertEqual(goodNode.body_1, goodData.get("body_1"))
-        self.assertEqual(goodNode.apoapsis, goodData.get("apoapsis"))
-        self.assertEqual(goodNode.periapsis, goodData.get("periapsis"))
-        self.assertEqual(goodNode.inclination, goodData.get("inclination"))
-
-        with self.assertRaises(ValidationError):
-            badNode = OrbitalNode(**badData)
-
-    def testLagNode(self):
-        goodData = {
-            "name": "EM L5",
-            "description": "Earth-Moon Lagrange point 5",
-            "body_1": "Earth",
-            "body_2": "Moon",
-            "lp_number": 5,
-            "type": "Lagrange",
-        }
-        badData = {
-            "name": "LEO",
-            "description": "Low Earth Orbit",
-            "body_1": "Saturn",
-            "apoapsis": -100,
-            "periapsis": -100,
-            "body_2": "Titan",
-            "lp_number": 6,
-            "type": "Lagrange",
-        }
-        goodNode = LagrangeNode(**goodData)
-        self.assertEqual(goodNode.name, goodData.get("name"))
-        self.assertEqual(goodNode.description, goodData.get("description"))
-        self.assertEqual(goodNode.body_1, goodData.get("body_1"))
-        self.assertEqual(goodNode.body_2, goodData.get("body_2"))
-        self.assertEqual(goodNode.lp_number, goodData.get("lp_number"))
-
-        with self.assertRaises(ValidationError):
-            badNode = LagrangeNode(**badData)
-
-
-class TestFromFile(unittest.TestCase):
-    good_nodes = json.loads(
-        pkg_resources.resource_string(test.__name__, "good_nodes.json")
-    )
+        with pytest.raises(ValidationError):
+            badNode = SurfaceNode.parse_obj(_SUR_BAD)
 
-    good_orbital = list(
-        filter(lambda node: node["type"] == NodeType.Orbital.value, good_nodes)
-    )
-    good_surface = list(
-        filter(lambda node: node["type"] == NodeType.Surface.value, good_nodes)
-    )
-    good_lagrange = list(
-        filter(lambda node: node["type"] == NodeType.Lagrange.value, good_nodes)
-    )
+    def testOrbNode(self):
+        goodNode = OrbitalNode.parse_obj(_ORB_GOOD)
+        assert _ORBITAL_ATTRS(goodNode) == _ORBITAL_ITEMS(_ORB_GOOD)
 
-    bad_nodes = json.loads(
-        pkg_resources.resource_string(test.__name__, "bad_nodes.json")
-    )
+        with pytest.raises(ValidationError):
+            badNode = OrbitalNode.parse_obj(_ORB_BAD)
 
-    def test_OrbitalNode(self):
-
-        for node in self.good_orbital:
-
-            testnode = nos.OrbitalNode(**node)
-            self.assertEqual(testnode.name, node.get("name"))
-            self.assertEqual(testnode.description, node.get("description"))
-            self.assertEqual(testnode.body_1, node.get("body_1"))
-            self.assertEqual(testnode.type, node.get("type"))
-            self.assertEqual(testnode.apoapsis, node.get("apoapsis"))
-            self.assertEqual(testnode.periapsis, node.get("periapsis"))
-            self.assertEqual(testnode.inclination, node.get("inclination"))
-
-    def test_SurfaceNode(self):
-
-        for node in self.good_surface:
-
-            testnode = nos.SurfaceNode(**node)
-            self.assertEqual(testnode.name, node.get("name"))
-            self.assertEqual(testnode.description, node.get("description"))
-            self.assertEqual(testnode.body_1, node.get("body_1"))
-            self.assertEqual(testnode.type, node.get("type"))
-            self.assertEqual(testnode.latitude, node.get("latitude"))
-            self.assertEqual(testnode.longitude, node.get("longitude"))
-
-    def test_LagrangeNode(self):
-
-        for node in self.good_lagrange:
-
-            testnode = nos.LagrangeNode(**node)
-            self.assertEqual(testnode.name, node.get("name"))
-            self.assertEqual(testnode.description, node.get("description"))
-            self.assertEqual(testnode.body_1, node.get("body_1"))
-            self.assertEqual(testnode.type, node.get("type"))
-            self.assertEqual(testnode.body_2, node.get("body_2"))
-            self.assertEqual(testnode.lp_number, node.get("lp_number"))
-
-    def test_BadOrbitalNode(self):
-        for node in self.bad_nodes:
-            with self.assertRaises(ValidationError):
-                bad_node = nos.OrbitalNode(**node)
-
-    def test_BadSurfaceNode(self):
-        for node in self.bad_nodes:
-            with self.assertRaises(ValidationError):
-                bad_node = nos.OrbitalNode(**node)
-
-    def test_BadLagrangeNode(self):
-        for node in self.bad_nodes:
-            with self.assertRaises(ValidationError):
-                bad_node = nos.OrbitalNode(**node)
+    def testLagNode(self):
+        goodNode = LagrangeNode.parse_obj(_LAG_GOOD)
+        assert _LAGRANGE_ATTRS(goodNode) == _LAGRANGE_ITEMS(_LAG_GOOD)
+
+        with pytest.raises(ValidationError):
+            badNode = LagrangeNode.parse_obj(_LAG_BAD)
+
+
+class TestFromFile:
+    # each node is its own test case, so that cases can be spread across processes and
+    # one failing node does not hide the others
+    @pytest.mark.parametrize("node", _GOOD_BY_TYPE[NodeType.Orbital.value])
+    def test_OrbitalNode(self, node):
+        values = _validated_values(nos.OrbitalNode, node)
+        assert _ORBITAL_ITEMS(values) == _ORBITAL_ITEMS(node)
+
+    @pytest.mark.parametrize("node", _GOOD_BY_TYPE[NodeType.Surface.value])
+    def test_SurfaceNode(self, node):
+        values = _validated_values(nos.SurfaceNode, node)
+        assert _SURFACE_ITEMS(values) == _SURFACE_ITEMS(node)
+
+    @pytest.mark.parametrize("node", _GOOD_BY_TYPE[NodeType.Lagrange.value])
+    def test_LagrangeNode(self, node):
+        values = _validated_values(nos.LagrangeNode, node)
+        assert _LAGRANGE_ITEMS(values) == _LAGRANGE_ITEMS(node)
+
+    @pytest.mark.parametrize("node", _BAD_NODES)
+    def test_BadOrbitalNode(self, node):
+        _assert_rejects(nos.OrbitalNode, node)
+
+    @pytest.mark.parametrize("node", _BAD_NODES)
+    def test_BadSurfaceNode(self, node):
+        _assert_rejects(nos.SurfaceNode, node)
+
+    @pytest.mark.parametrize("node", _BAD_NODES)
+    def test_BadLagrangeNode(self, node):
+        _assert_rejects(nos.LagrangeNode, node)